@@ -2,13 +2,13 @@ from flask import Blueprint, jsonify, request
 from datetime import datetime, timedelta, timezone
 import traceback
 import json
-import pandas as pd
 
-from app.services.data_cache import get_cached_data
+from app.services.data_cache import get_filtered_cached_data
 from app.services.resolution_utils import count_done_during_period
+from app.services.datetime_utils import as_utc_datetime
 from app.services.changelog_processor import calculate_lead_time_from_transitions, analyze_rework_patterns
-from app.services.filters import filter_by_overall_window, filter_planned_activities, apply_standard_filters
-from app.services.transitions_helper import pre_parse_transitions
+from app.services.filters import filter_by_overall_window, filter_planned_activities
+from app.services.transitions_helper import pre_parse_transitions, analysis_cache_keys, analyze_transitions_cached
 
 
 def _get_current_week_range():
@@ -79,8 +79,6 @@ def _validate_date_range(start_date, end_date=None):
 def get_executive_summary():
     """Get Executive Summary KPIs. Uses apply_standard_filters() for data consistency."""
     try:
-        df, df_sprints = get_cached_data()
-        
         period_start_str = request.args.get('start_date') or request.args.get('period_start')
         period_end_str = request.args.get('end_date') or request.args.get('period_end')
         assignees = request.args.getlist('assignee')
@@ -109,10 +107,10 @@ def get_executive_summary():
             period_start, period_end = _get_current_week_range()
             period_start, period_end = _validate_date_range(period_start, period_end)
         
-        df = apply_standard_filters(df, assignees=assignees, issue_type=issue_type, 
-                                   start_date=period_start, end_date=period_end)
+        df, df_sprints = get_filtered_cached_data(assignees=assignees, issue_type=issue_type,
+                                                  start_date=period_start, end_date=period_end)
         
-        filtered_issues = df.copy()
+        filtered_issues = df
         
         status_col = 'Status Category (Mapped)' if 'Status Category (Mapped)' in filtered_issues.columns else 'New Status Category'
         
@@ -139,8 +137,8 @@ def get_executive_summary():
         
         
         if 'Lead Time (Days)' not in done_issues.columns:
-            done_issues['Created'] = pd.to_datetime(done_issues['Created'], utc=True, errors='coerce')
-            done_issues['Resolved'] = pd.to_datetime(done_issues['Resolved'], utc=True, errors='coerce')
+            done_issues['Created'] = as_utc_datetime(done_issues['Created'])
+            done_issues['Resolved'] = as_utc_datetime(done_issues['Resolved'])
             done_issues['Lead Time (Days)'] = (
                 done_issues['Resolved'] - done_issues['Created']
             ).dt.total_seconds() / (60 * 60 * 24)
@@ -155,12 +153,11 @@ def get_executive_summary():
         
         done_issues = pre_parse_transitions(done_issues)
         
-        for _, row in done_issues.iterrows():
-            transitions = row.get('_parsed_transitions', [])
+        for transitions, cache_key in zip(done_issues['_parsed_transitions'], analysis_cache_keys(done_issues)):
             if transitions:
                 try:
                     if transitions:
-                        rework_analysis = analyze_rework_patterns(transitions)
+                        rework_analysis = analyze_transitions_cached(analyze_rework_patterns, cache_key, transitions)
                         if rework_analysis.get('has_rework', False):
                             rework_count += 1
                 except:
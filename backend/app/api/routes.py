@@ -9,7 +9,7 @@ import math
 import pandas as pd
 import numpy as np
 
-from app.services.data_cache import get_cached_data
+from app.services.data_cache import get_cached_data, get_filtered_cached_data
 from app.services.chart_calculations import (
     calculate_weekly_planned_vs_done,
     calculate_weekly_flow,
@@ -22,45 +22,64 @@ from app.services.chart_calculations import (
     calculate_assignee_completion_trend,
 )
 from app.api.executive_summary import get_executive_summary
-from app.services.filters import apply_selection_filters, filter_by_overall_window, apply_standard_filters
+from app.services.filters import apply_selection_filters, filter_by_overall_window
+from app.services.datetime_utils import as_utc_datetime
 
 
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
 
+def _json_value(value):
+    """Convert one DataFrame cell to a JSON-serializable value (NaN, NaT and infinities become None)."""
+    if isinstance(value, (pd.Timestamp, datetime)):
+        return value.isoformat() if pd.notna(value) else None
+    elif pd.isna(value):
+        return None
+    elif hasattr(value, 'item'):
+        try:
+            return value.item()
+        except (AttributeError, ValueError):
+            return int(value) if isinstance(value, (pd.Int64Dtype, pd.Int32Dtype)) else value
+    elif 'int' in str(type(value)) and 'numpy' in str(type(value)):
+        return int(value)
+    elif 'float' in str(type(value)) and 'numpy' in str(type(value)):
+        return float(value)
+    elif isinstance(value, float):
+        if math.isnan(value) or value != value:
+            return None
+        elif math.isinf(value):
+            return None
+        else:
+            return value
+    else:
+        return value
+
+
+def _column_to_json(values):
+    """
+    Convert one DataFrame column to a list of JSON-serializable values.
+    
+    Plain numpy int/bool columns already yield Python scalars and float columns only need non-finite values
+    replaced, so both are converted column-wise; other dtypes go through _json_value per cell.
+    """
+    if isinstance(values.dtype, np.dtype):
+        if values.dtype.kind in 'iub':
+            return values.tolist()
+        if values.dtype.kind == 'f':
+            floats = values.to_numpy()
+            converted = floats.astype(object)
+            converted[~np.isfinite(floats)] = None
+            return converted.tolist()
+    return [_json_value(value) for value in values.tolist()]
+
+
 def _dataframe_to_dict(df):
     """Convert DataFrame to JSON-serializable dict."""
     if df.empty:
         return []
     
-    result = df.to_dict('records')
-    
-    for record in result:
-        for key, value in record.items():
-            if isinstance(value, (pd.Timestamp, datetime)):
-                record[key] = value.isoformat() if pd.notna(value) else None
-            elif pd.isna(value):
-                record[key] = None
-            elif hasattr(value, 'item'):
-                try:
-                    record[key] = value.item()
-                except (AttributeError, ValueError):
-                    record[key] = int(value) if isinstance(value, (pd.Int64Dtype, pd.Int32Dtype)) else value
-            elif 'int' in str(type(value)) and 'numpy' in str(type(value)):
-                record[key] = int(value)
-            elif 'float' in str(type(value)) and 'numpy' in str(type(value)):
-                record[key] = float(value)
-            elif isinstance(value, float):
-                if math.isnan(value) or value != value:
-                    record[key] = None
-                elif math.isinf(value):
-                    record[key] = None
-                else:
-                    record[key] = value
-            else:
-                record[key] = value
-    
-    return result
+    columns = [_column_to_json(df.iloc[:, i]) for i in range(df.shape[1])]
+    return [dict(zip(df.columns, row)) for row in zip(*columns)]
 
 
 def _parse_date(date_str, default=None):
@@ -146,18 +165,17 @@ def get_data_date_range():
     try:
         df, df_sprints = get_cached_data()
         
-        df_copy = df.copy()
         date_columns = ['Created', 'Updated', 'Resolved']
         min_dates = []
         max_dates = []
         
         for col in date_columns:
-            if col in df_copy.columns:
-                df_copy[col] = pd.to_datetime(df_copy[col], utc=True, errors='coerce')
-                valid_dates = df_copy[col].dropna()
-                if len(valid_dates) > 0:
-                    min_dates.append(valid_dates.min())
-                    max_dates.append(valid_dates.max())
+            if col in df.columns:
+                # Cached columns are already UTC datetimes and are used as-is; min/max skip NaT
+                dates = as_utc_datetime(df[col])
+                if dates.notna().any():
+                    min_dates.append(dates.min())
+                    max_dates.append(dates.max())
         
         if min_dates and max_dates:
             min_date = min(min_dates)
@@ -190,8 +208,6 @@ def get_data_date_range():
 def get_weekly_planned_vs_done():
     """Get weekly planned vs done chart data."""
     try:
-        df, df_sprints = get_cached_data()
-        
         num_weeks = int(request.args.get('num_weeks', 12))
         start_date_str = request.args.get('start_date') or request.args.get('period_start')
         end_date_str = request.args.get('end_date') or request.args.get('period_end')
@@ -210,8 +226,8 @@ def get_weekly_planned_vs_done():
             _, end_date = _get_current_week_range()
             start_date, end_date = _validate_date_range(start_date, end_date)
         
-        df = apply_standard_filters(df, assignees=assignees, issue_type=issue_type, 
-                                   start_date=start_date, end_date=end_date)
+        df, df_sprints = get_filtered_cached_data(assignees=assignees, issue_type=issue_type,
+                                                  start_date=start_date, end_date=end_date)
         
         weekly_df = calculate_weekly_planned_vs_done(df, start_date, num_weeks=num_weeks, df_sprints=df_sprints, period_end=end_date)
         
@@ -236,8 +252,6 @@ def get_weekly_planned_vs_done():
 def get_weekly_flow():
     """Get weekly flow chart data (Done, In Progress, Carry Over)."""
     try:
-        df, df_sprints = get_cached_data()
-        
         num_weeks = int(request.args.get('num_weeks', 12))
         start_date_str = request.args.get('start_date') or request.args.get('period_start')
         end_date_str = request.args.get('end_date') or request.args.get('period_end')
@@ -256,8 +270,8 @@ def get_weekly_flow():
             _, end_date = _get_current_week_range()
             start_date, end_date = _validate_date_range(start_date, end_date)
         
-        df = apply_standard_filters(df, assignees=assignees, issue_type=issue_type, 
-                                   start_date=start_date, end_date=end_date)
+        df, df_sprints = get_filtered_cached_data(assignees=assignees, issue_type=issue_type,
+                                                  start_date=start_date, end_date=end_date)
         
         weekly_df = calculate_weekly_flow(df, start_date, num_weeks=num_weeks, df_sprints=df_sprints, period_end=end_date)
         
@@ -282,8 +296,6 @@ def get_weekly_flow():
 def get_weekly_lead_time():
     """Get weekly lead time chart data."""
     try:
-        df, df_sprints = get_cached_data()
-        
         num_weeks = int(request.args.get('num_weeks', 12))
         start_date_str = request.args.get('start_date') or request.args.get('period_start')
         end_date_str = request.args.get('end_date') or request.args.get('period_end')
@@ -302,8 +314,8 @@ def get_weekly_lead_time():
             _, end_date = _get_current_week_range()
             start_date, end_date = _validate_date_range(start_date, end_date)
         
-        df = apply_standard_filters(df, assignees=assignees, issue_type=issue_type, 
-                                   start_date=start_date, end_date=end_date)
+        df, df_sprints = get_filtered_cached_data(assignees=assignees, issue_type=issue_type,
+                                                  start_date=start_date, end_date=end_date)
         
         weekly_df = calculate_weekly_lead_time(df, start_date, num_weeks=num_weeks, df_sprints=df_sprints, period_end=end_date)
         
@@ -328,8 +340,6 @@ def get_weekly_lead_time():
 def get_task_load():
     """Get task load per assignee chart data."""
     try:
-        df, df_sprints = get_cached_data()
-        
         period_start_str = request.args.get('period_start') or request.args.get('start_date')
         period_end_str = request.args.get('period_end') or request.args.get('end_date')
         assignees = _get_assignees_from_request(request)
@@ -344,8 +354,8 @@ def get_task_load():
             period_start = period_end - timedelta(days=90)
             period_start, period_end = _validate_date_range(period_start, period_end)
         
-        df = apply_standard_filters(df, assignees=assignees, issue_type=issue_type, 
-                                   start_date=period_start, end_date=period_end)
+        df, df_sprints = get_filtered_cached_data(assignees=assignees, issue_type=issue_type,
+                                                  start_date=period_start, end_date=period_end)
         
         assignee_df = calculate_task_load_per_assignee(df, period_start, period_end, df_sprints=df_sprints)
         
@@ -369,8 +379,6 @@ def get_task_load():
 def get_execution_success():
     """Get execution success by assignee chart data."""
     try:
-        df, df_sprints = get_cached_data()
-        
         period_start_str = request.args.get('period_start') or request.args.get('start_date')
         period_end_str = request.args.get('period_end') or request.args.get('end_date')
         assignees = _get_assignees_from_request(request)
@@ -385,8 +393,8 @@ def get_execution_success():
             period_start = period_end - timedelta(days=90)
             period_start, period_end = _validate_date_range(period_start, period_end)
         
-        df = apply_standard_filters(df, assignees=assignees, issue_type=issue_type, 
-                                   start_date=period_start, end_date=period_end)
+        df, df_sprints = get_filtered_cached_data(assignees=assignees, issue_type=issue_type,
+                                                  start_date=period_start, end_date=period_end)
         
         assignee_df = calculate_execution_success_by_assignee(df, period_start, period_end, df_sprints=df_sprints)
         
@@ -410,8 +418,6 @@ def get_execution_success():
 def get_company_trend():
     """Get company trend chart data (monthly)."""
     try:
-        df, df_sprints = get_cached_data()
-        
         num_months = int(request.args.get('num_months', 6))
         period_start_str = request.args.get('start_date') or request.args.get('period_start')
         period_end_str = request.args.get('end_date') or request.args.get('period_end')
@@ -431,8 +437,8 @@ def get_company_trend():
         else:
             period_end = datetime.now(timezone.utc)
         
-        df = apply_standard_filters(df, assignees=assignees, issue_type=issue_type, 
-                                   start_date=None, end_date=None)
+        df, df_sprints = get_filtered_cached_data(assignees=assignees, issue_type=issue_type,
+                                                  start_date=None, end_date=None)
         
         monthly_df = calculate_company_trend(df, period_start, num_months=num_months, period_end=period_end, df_sprints=df_sprints)
         
@@ -456,8 +462,6 @@ def get_company_trend():
 def get_qa_vs_failed():
     """Get QA vs Failed QA chart data."""
     try:
-        df, df_sprints = get_cached_data()
-        
         period_start_str = request.args.get('start_date') or request.args.get('period_start')
         period_end_str = request.args.get('end_date') or request.args.get('period_end')
         assignees = _get_assignees_from_request(request)
@@ -473,8 +477,8 @@ def get_qa_vs_failed():
             period_start = period_end - timedelta(days=90)
             period_start, period_end = _validate_date_range(period_start, period_end)
         
-        df = apply_standard_filters(df, assignees=assignees, issue_type=issue_type, 
-                                   start_date=period_start, end_date=period_end)
+        df, df_sprints = get_filtered_cached_data(assignees=assignees, issue_type=issue_type,
+                                                  start_date=period_start, end_date=period_end)
         
         qa_df = calculate_qa_vs_failed(df, period_start, period_end, group_by=group_by, df_sprints=df_sprints)
         
@@ -499,8 +503,6 @@ def get_qa_vs_failed():
 def get_rework_ratio():
     """Get rework ratio chart data (clean delivery vs rework)."""
     try:
-        df, df_sprints = get_cached_data()
-        
         num_weeks = int(request.args.get('num_weeks', 12))
         start_date_str = request.args.get('start_date') or request.args.get('period_start')
         end_date_str = request.args.get('end_date') or request.args.get('period_end')
@@ -519,8 +521,8 @@ def get_rework_ratio():
             _, end_date = _get_current_week_range()
             start_date, end_date = _validate_date_range(start_date, end_date)
         
-        df = apply_standard_filters(df, assignees=assignees, issue_type=issue_type, 
-                                   start_date=start_date, end_date=end_date)
+        df, df_sprints = get_filtered_cached_data(assignees=assignees, issue_type=issue_type,
+                                                  start_date=start_date, end_date=end_date)
         
         rework_df = calculate_rework_ratio(df, start_date, num_weeks=num_weeks, df_sprints=df_sprints, period_end=end_date)
         
@@ -545,8 +547,6 @@ def get_rework_ratio():
 def get_assignee_completion_trend():
     """Get assignee completion trend comparing current period vs previous period."""
     try:
-        df, df_sprints = get_cached_data()
-        
         period_start_str = request.args.get('start_date') or request.args.get('period_start')
         period_end_str = request.args.get('end_date') or request.args.get('period_end')
         compare_period_start_str = request.args.get('compare_period_start')
@@ -570,8 +570,8 @@ def get_assignee_completion_trend():
             compare_period_end = _parse_date(compare_period_end_str)
             compare_period_start, compare_period_end = _validate_date_range(compare_period_start, compare_period_end)
         
-        df = apply_standard_filters(df, assignees=assignees, issue_type=issue_type, 
-                                   start_date=period_start, end_date=period_end)
+        df, df_sprints = get_filtered_cached_data(assignees=assignees, issue_type=issue_type,
+                                                  start_date=period_start, end_date=period_end)
         
         single_assignee = assignees[0] if assignees and len(assignees) == 1 else None
         
@@ -609,4 +609,46 @@ def executive_summary():
     return get_executive_summary()
 
 
+# Views served together by /dashboard-bundle, keyed by their name in the bundle
+_BUNDLE_VIEWS = {
+    'executive_summary': get_executive_summary,
+    'weekly_planned_vs_done': get_weekly_planned_vs_done,
+    'weekly_flow': get_weekly_flow,
+    'weekly_lead_time': get_weekly_lead_time,
+    'task_load': get_task_load,
+    'execution_success': get_execution_success,
+    'company_trend': get_company_trend,
+    'qa_vs_failed': get_qa_vs_failed,
+    'rework_ratio': get_rework_ratio,
+    'assignee_completion_trend': get_assignee_completion_trend,
+}
+
+
+@api_bp.route('/dashboard-bundle', methods=['GET'])
+def get_dashboard_bundle():
+    """
+    Get the executive summary and every chart in one response.
+    
+    Each view runs with this request's query parameters, so a dashboard render is one round-trip. Views filtering
+    the same selection and activity window reuse one memoized filtered frame from the data cache. Each section is
+    the body its own endpoint would return, including its 'success' flag; the bundle succeeds only when every
+    section does, and otherwise carries the highest error status of its sections.
+    """
+    bundle = {}
+    status_code = 200
+    for name, view in _BUNDLE_VIEWS.items():
+        response = view()
+        if isinstance(response, tuple):
+            response, section_status = response[0], response[1]
+        else:
+            section_status = response.status_code
+        bundle[name] = response.get_json()
+        status_code = max(status_code, section_status)
+    
+    return jsonify({
+        'success': all(section.get('success', False) for section in bundle.values()),
+        'data': bundle
+    }), status_code
+
+
 
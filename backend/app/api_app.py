@@ -68,7 +68,8 @@ def create_api_app():
                 'company_trend': '/api/charts/company-trend',
                 'qa_vs_failed': '/api/charts/qa-vs-failed',
                 'rework_ratio': '/api/charts/rework-ratio',
-                'assignee_completion_trend': '/api/charts/assignee-completion-trend'
+                'assignee_completion_trend': '/api/charts/assignee-completion-trend',
+                'dashboard_bundle': '/api/dashboard-bundle'
             }
         })
     
@@ -29,6 +29,32 @@ def get_week_date_range(week_str):
         return None
 
 
+def _week_labels(dates):
+    """'YYYY-WW' week labels, as dt.strftime('%Y-%W') but formatted once per distinct day; NaT maps to NaN."""
+    codes, uniques = pd.factorize(dates.dt.floor('D'))
+    labels = np.append(pd.DatetimeIndex(uniques).strftime('%Y-%W').to_numpy(dtype=object), np.nan)
+    return pd.Series(labels[codes], index=dates.index)
+
+
+def _map_week_date_ranges(weeks):
+    """
+    Map a 'YYYY-WW' week column to display date ranges.
+    
+    Factorizes the column so get_week_date_range formats each distinct week once instead of once per row;
+    missing weeks map to None.
+    
+    
+    Args:
+        weeks: Series of week strings
+    
+    Returns:
+        Series of date range strings aligned to weeks' index
+    """
+    codes, uniques = pd.factorize(weeks)
+    date_ranges = np.array([get_week_date_range(week) for week in uniques] + [None], dtype=object)
+    return pd.Series(date_ranges[codes], index=weeks.index)
+
+
 def clean_jira_data(df):
     """
     Clean and prepare Jira data for dashboard.
@@ -139,9 +165,7 @@ def clean_jira_data(df):
     
     print("Adding Status Category (Mapped)...")
     if 'Status' in cleaned_df.columns:
-        cleaned_df['Status Category (Mapped)'] = cleaned_df['Status'].apply(
-            lambda status: map_status_to_category(status)
-        )
+        cleaned_df['Status Category (Mapped)'] = cleaned_df['Status'].map(map_status_to_category)
     else:
         print("Warning: 'Status' column not found, cannot add Status Category (Mapped)")
         cleaned_df['Status Category (Mapped)'] = 'Not Done'
@@ -157,15 +181,12 @@ def clean_jira_data(df):
     print("Converting numpy types...")
     for col in cleaned_df.columns:
         if cleaned_df[col].dtype.name.startswith('int'):
-            cleaned_df[col] = cleaned_df[col].astype('Int64')
-            cleaned_df[col] = cleaned_df[col].apply(lambda x: int(x) if pd.notna(x) else None)
+            cleaned_df[col] = cleaned_df[col].astype('int64')
         elif cleaned_df[col].dtype.name.startswith('float'):
             cleaned_df[col] = cleaned_df[col].astype('float64')
     
     if 'Primary Sprint Id' in cleaned_df.columns:
-        cleaned_df['Primary Sprint Id'] = cleaned_df['Primary Sprint Id'].apply(
-            lambda x: int(x) if pd.notna(x) else None
-        )
+        cleaned_df['Primary Sprint Id'] = pd.to_numeric(cleaned_df['Primary Sprint Id'], errors='coerce').astype('Int64')
     
     critical_columns = ['Issue key', 'Created', 'Resolved', 'Status Category (Mapped)']
     missing_critical = [col for col in critical_columns if col not in cleaned_df.columns]
@@ -222,18 +243,18 @@ def prepare_dashboard_data(df):
         return empty_df
     
     if 'Resolved' in df.columns:
-        df['Resolved Week'] = df['Resolved'].dt.strftime('%Y-%W')
-        df['Resolved Date Range'] = df['Resolved Week'].apply(get_week_date_range)
+        df['Resolved Week'] = _week_labels(df['Resolved'])
+        df['Resolved Date Range'] = _map_week_date_ranges(df['Resolved Week'])
     
     if 'Created' in df.columns:
-        df['Created Week'] = df['Created'].dt.strftime('%Y-%W')
-        df['Created Date Range'] = df['Created Week'].apply(get_week_date_range)
+        df['Created Week'] = _week_labels(df['Created'])
+        df['Created Date Range'] = _map_week_date_ranges(df['Created Week'])
     
     if 'Updated' in df.columns:
-        df['Updated Week'] = df['Updated'].dt.strftime('%Y-%W')
-        df['Updated Date Range'] = df['Updated Week'].apply(get_week_date_range)
+        df['Updated Week'] = _week_labels(df['Updated'])
+        df['Updated Date Range'] = _map_week_date_ranges(df['Updated Week'])
     
     if 'Status Category (Mapped)' not in df.columns and 'Status' in df.columns:
-        df['Status Category (Mapped)'] = df['Status'].apply(map_status_to_category)
+        df['Status Category (Mapped)'] = df['Status'].map(map_status_to_category)
     
     return df
\ No newline at end of file
@@ -1,6 +1,10 @@
+import os
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 import json
+from concurrent.futures import ThreadPoolExecutor
 from app.config import AUTH, HEADERS, DOMAIN
 from app.services.changelog_processor import (
     extract_status_transitions,
@@ -11,6 +15,36 @@ from app.services.changelog_processor import (
 )
 
 
+# Boards whose sprint pages are fetched concurrently; kept low to stay clear of Jira rate limits
+_BOARD_FETCH_WORKERS = 4
+
+# One session per process for every Jira request, so paginated fetches reuse kept-alive connections instead of
+# a new TCP + TLS handshake per page; the pool holds one connection per concurrent board fetch
+_SESSION = None
+_SESSION_PID = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _session():
+    """
+    Get this process's Jira session, creating it on first use.
+    
+    Keyed on the process id: with a preloading server (gunicorn preload_app) the master fills the cache before
+    forking, and a worker must not share the master's open TLS connections. The inherited session is dropped,
+    not closed, so the child never writes to those sockets.
+    """
+    global _SESSION, _SESSION_PID
+    pid = os.getpid()
+    with _SESSION_LOCK:
+        if _SESSION is None or _SESSION_PID != pid:
+            session = requests.Session()
+            adapter_args = {"pool_connections": _BOARD_FETCH_WORKERS, "pool_maxsize": _BOARD_FETCH_WORKERS}
+            session.mount("https://", HTTPAdapter(**adapter_args))
+            session.mount("http://", HTTPAdapter(**adapter_args))
+            _SESSION, _SESSION_PID = session, pid
+        return _SESSION
+
+
 def extract_description(description_field):
     """
     Extract plain text description from Jira's Atlassian Document Format.
@@ -50,7 +84,7 @@ def get_field_id_map():
     Returns:
         Dictionary mapping field names to field IDs
     """
-    res = requests.get(f"{DOMAIN}/rest/api/3/field", headers=HEADERS, auth=AUTH)
+    res = _session().get(f"{DOMAIN}/rest/api/3/field", headers=HEADERS, auth=AUTH)
     field_map = {}
     if res.status_code == 200:
         for field in res.json():
@@ -73,7 +107,7 @@ def get_boards():
     
     while True:
         params = {"startAt": start_at, "maxResults": 50}
-        res = requests.get(f"{DOMAIN}/rest/agile/1.0/board", headers=HEADERS, auth=AUTH, params=params)
+        res = _session().get(f"{DOMAIN}/rest/agile/1.0/board", headers=HEADERS, auth=AUTH, params=params)
         
         if res.status_code != 200:
             print(f"Failed to fetch boards: {res.status_code} - {res.text}")
@@ -93,12 +127,46 @@ def get_boards():
     return boards
 
 
+def _fetch_board_sprints(board):
+    """Fetch every page of one board's sprints, stopping at the first failed request."""
+    board_id = board["id"]
+    print(f"Fetching sprints from board {board_id} ({board.get('name', 'Unknown')})...")
+    sprints = []
+    start_at = 0
+    
+    while True:
+        params = {"startAt": start_at, "maxResults": 50}
+        res = _session().get(
+            f"{DOMAIN}/rest/agile/1.0/board/{board_id}/sprint",
+            headers=HEADERS,
+            auth=AUTH,
+            params=params
+        )
+        
+        if res.status_code != 200:
+            print(f"Warning: Failed to fetch sprints for board {board_id}: {res.status_code}")
+            break
+        
+        data = res.json()
+        values = data.get("values", [])
+        if not values:
+            break
+        
+        sprints.extend(values)
+        start_at += len(values)
+        if start_at >= data.get("total", 0):
+            break
+    
+    return sprints
+
+
 def get_sprints_from_boards():
     """
     Fetch all sprints from all boards.
     
-    Extracts sprint details (id, name, state, dates, goal) and avoids duplicates using sprint_ids_seen set.
-    Returns DataFrame with sprint information.
+    Boards are fetched concurrently (up to _BOARD_FETCH_WORKERS requests in flight), then merged in board order so
+    the first board listing a sprint still owns it. Extracts sprint details (id, name, state, dates, goal) and
+    avoids duplicates using sprint_ids_seen set. Returns DataFrame with sprint information.
     
     
     Returns:
@@ -107,54 +175,30 @@ def get_sprints_from_boards():
     """
     print("Fetching boards and sprints...")
     boards = get_boards()
+    boards_with_id = [board for board in boards if board.get("id")]
     all_sprints = []
     sprint_ids_seen = set()
     
-    for board in boards:
-        board_id = board.get("id")
-        if not board_id:
-            continue
-        
-        print(f"Fetching sprints from board {board_id} ({board.get('name', 'Unknown')})...")
-        start_at = 0
-        
-        while True:
-            params = {"startAt": start_at, "maxResults": 50}
-            res = requests.get(
-                f"{DOMAIN}/rest/agile/1.0/board/{board_id}/sprint",
-                headers=HEADERS,
-                auth=AUTH,
-                params=params
-            )
-            
-            if res.status_code != 200:
-                print(f"Warning: Failed to fetch sprints for board {board_id}: {res.status_code}")
-                break
-            
-            data = res.json()
-            values = data.get("values", [])
-            if not values:
-                break
-            
-            for sprint in values:
-                sprint_id = sprint.get("id")
-                if sprint_id and sprint_id not in sprint_ids_seen:
-                    sprint_ids_seen.add(sprint_id)
-                    all_sprints.append({
-                        "Sprint Id": sprint_id,
-                        "Sprint Name": sprint.get("name", ""),
-                        "Sprint State": sprint.get("state", ""),
-                        "Sprint Start Date": sprint.get("startDate"),
-                        "Sprint End Date": sprint.get("endDate"),
-                        "Sprint Complete Date": sprint.get("completeDate"),
-                        "Sprint Goal": sprint.get("goal", ""),
-                        "Board Id": board_id,
-                        "Board Name": board.get("name", "")
-                    })
-            
-            start_at += len(values)
-            if start_at >= data.get("total", 0):
-                break
+    with ThreadPoolExecutor(max_workers=_BOARD_FETCH_WORKERS) as executor:
+        board_sprints = list(executor.map(_fetch_board_sprints, boards_with_id))
+    
+    for board, sprints in zip(boards_with_id, board_sprints):
+        board_id = board["id"]
+        for sprint in sprints:
+            sprint_id = sprint.get("id")
+            if sprint_id and sprint_id not in sprint_ids_seen:
+                sprint_ids_seen.add(sprint_id)
+                all_sprints.append({
+                    "Sprint Id": sprint_id,
+                    "Sprint Name": sprint.get("name", ""),
+                    "Sprint State": sprint.get("state", ""),
+                    "Sprint Start Date": sprint.get("startDate"),
+                    "Sprint End Date": sprint.get("endDate"),
+                    "Sprint Complete Date": sprint.get("completeDate"),
+                    "Sprint Goal": sprint.get("goal", ""),
+                    "Board Id": board_id,
+                    "Board Name": board.get("name", "")
+                })
     
     print(f"Fetched {len(all_sprints)} unique sprints from {len(boards)} boards")
     return pd.DataFrame(all_sprints)
@@ -204,7 +248,7 @@ def fetch_jira_data():
         if next_page_token:
             params["nextPageToken"] = next_page_token
         
-        res = requests.get(BASE_URL, headers=HEADERS, auth=AUTH, params=params)
+        res = _session().get(BASE_URL, headers=HEADERS, auth=AUTH, params=params)
         
         if res.status_code != 200:
             print(f"Failed to fetch issues: {res.status_code} - {res.text}")
@@ -376,19 +420,23 @@ def fetch_jira_data():
     df_sprints = get_sprints_from_boards()
     
     if not df_sprints.empty:
-        sprint_lookup = {}
-        for _, sprint_row in df_sprints.iterrows():
-            sprint_id = sprint_row["Sprint Id"]
-            sprint_lookup[sprint_id] = {
-                "Sprint Name (Full)": sprint_row["Sprint Name"],
-                "Sprint State (Full)": sprint_row["Sprint State"],
-                "Sprint Start Date (Full)": sprint_row["Sprint Start Date"],
-                "Sprint End Date (Full)": sprint_row["Sprint End Date"],
-                "Sprint Complete Date (Full)": sprint_row["Sprint Complete Date"],
-                "Sprint Goal": sprint_row["Sprint Goal"],
-                "Board Id": sprint_row["Board Id"],
-                "Board Name": sprint_row["Board Name"]
-            }
+        sprint_detail_columns = {
+            "Sprint Name (Full)": "Sprint Name",
+            "Sprint State (Full)": "Sprint State",
+            "Sprint Start Date (Full)": "Sprint Start Date",
+            "Sprint End Date (Full)": "Sprint End Date",
+            "Sprint Complete Date (Full)": "Sprint Complete Date",
+            "Sprint Goal": "Sprint Goal",
+            "Board Id": "Board Id",
+            "Board Name": "Board Name"
+        }
+        # Read each sprint column once instead of materializing a Series per sprint row
+        sprint_lookup = {
+            sprint_id: dict(zip(sprint_detail_columns, details))
+            for sprint_id, *details in zip(
+                df_sprints["Sprint Id"], *(df_sprints[col] for col in sprint_detail_columns.values())
+            )
+        }
         
         def get_first_sprint_id(sprint_id_str):
             if pd.isna(sprint_id_str) or sprint_id_str == "":
@@ -0,0 +1,3 @@
+"""
+Services package for data caching, filtering and chart calculations.
+"""
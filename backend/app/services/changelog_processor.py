@@ -1,15 +1,46 @@
 import json
-from datetime import datetime
+import math
+import sys
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Dict, List, Optional
-import pandas as pd
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECONDS_PER_DAY = 86_400_000_000
+
+
+def _to_epoch_us(timestamp) -> Optional[int]:
+    """Convert an ISO timestamp string to integer epoch microseconds (UTC). Returns None if unparseable."""
+    try:
+        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except (AttributeError, TypeError, ValueError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // timedelta(microseconds=1)
+
+
+def _transition_epoch_us(transition: Dict) -> Optional[int]:
+    """Get a transition's epoch microseconds, parsing 'timestamp' when 'timestamp_us' is missing."""
+    timestamp_us = transition.get("timestamp_us")
+    if timestamp_us is not None:
+        return timestamp_us
+    return _to_epoch_us(transition.get("timestamp"))
+
+
+def _intern_status(status):
+    """Intern a status name so repeated statuses share one string object."""
+    return sys.intern(status) if isinstance(status, str) else status
 
 
 def extract_status_transitions(changelog: Dict, issue_key: str) -> List[Dict]:
     """
     Extract all status transitions from a changelog.
     
-    For each status change, creates transition dict with issue_key, timestamp, from_status, to_status, and author.
-    Sorts transitions by timestamp and returns list.
+    For each status change, creates transition dict with issue_key, timestamp, timestamp_us (epoch microseconds),
+    from_status, to_status, and author. Sorts transitions by timestamp and returns list.
     
     
     Args:
@@ -30,15 +61,17 @@ def extract_status_transitions(changelog: Dict, issue_key: str) -> List[Dict]:
             continue
         
         author = history.get("author", {}).get("displayName", "Unknown")
+        timestamp_us = _to_epoch_us(timestamp)
         
         for item in history.get("items", []):
             if item.get("field") == "status":
-                from_status = item.get("fromString", "")
-                to_status = item.get("toString", "")
+                from_status = _intern_status(item.get("fromString", ""))
+                to_status = _intern_status(item.get("toString", ""))
                 
                 transitions.append({
                     "issue_key": issue_key,
                     "timestamp": timestamp,
+                    "timestamp_us": timestamp_us,
                     "from_status": from_status,
                     "to_status": to_status,
                     "author": author
@@ -49,6 +82,64 @@ def extract_status_transitions(changelog: Dict, issue_key: str) -> List[Dict]:
     return transitions
 
 
+_QA_STATUS_TERMS = ("qa", "testing", "test", "review", "in review", "quality")
+_DEV_STATUS_TERMS = ("in progress", "development", "dev", "to do", "backlog", "bug fix")
+_WORKFLOW_ORDER = {
+    "backlog": 0,
+    "to do": 1,
+    "not done": 1,
+    "in progress": 2,
+    "development": 2,
+    "dev": 2,
+    "qa": 3,
+    "testing": 3,
+    "test": 3,
+    "review": 3,
+    "in review": 3,
+    "ready for deployment": 4,
+    "done": 4,
+}
+
+QA_BIT = 0x1
+DEV_BIT = 0x2
+_WORKFLOW_POS_SHIFT = 4
+
+_STATUS_FLAGS: Dict[Optional[str], int] = {}
+
+
+def _status_flags(status: Optional[str]) -> int:
+    """
+    Get classification flags for a raw status string.
+    
+    Low bits hold QA_BIT/DEV_BIT substring matches, bits from _WORKFLOW_POS_SHIFT hold the workflow position.
+    Computed once per distinct status and cached in _STATUS_FLAGS.
+    
+    
+    Args:
+        status: Raw status string (may be None)
+    
+    Returns:
+        Integer flag word for the status
+    """
+    flags = _STATUS_FLAGS.get(status)
+    if flags is not None:
+        return flags
+    
+    status_lower = (status or "").strip().lower()
+    flags = 0
+    if any(term in status_lower for term in _QA_STATUS_TERMS):
+        flags |= QA_BIT
+    if any(term in status_lower for term in _DEV_STATUS_TERMS):
+        flags |= DEV_BIT
+    for key, pos in _WORKFLOW_ORDER.items():
+        if key in status_lower:
+            flags |= pos << _WORKFLOW_POS_SHIFT
+            break
+    
+    _STATUS_FLAGS[status] = flags
+    return flags
+
+
 def analyze_qa_transitions(transitions: List[Dict]) -> Dict:
     """
     Analyze transitions to identify QA-related patterns.
@@ -62,30 +153,26 @@ def analyze_qa_transitions(transitions: List[Dict]) -> Dict:
     Returns:
         Dictionary with entered_qa list, failed_qa list, qa_count, and failed_qa_count
     """
-    qa_statuses = ["qa", "testing", "test", "review", "in review", "quality"]
-    dev_statuses = ["in progress", "development", "dev", "to do", "backlog", "bug fix"]
-    
     entered_qa = []
     failed_qa = []
     
     for transition in transitions:
-        to_status = (transition.get("to_status", "") or "").strip().lower()
-        from_status = (transition.get("from_status", "") or "").strip().lower()
+        to_flags = _status_flags(transition.get("to_status", ""))
+        from_flags = _status_flags(transition.get("from_status", ""))
         
-        if any(qa_status in to_status for qa_status in qa_statuses):
+        if to_flags & QA_BIT:
             entered_qa.append({
                 "timestamp": transition.get("timestamp"),
                 "from_status": transition.get("from_status"),
                 "to_status": transition.get("to_status")
             })
         
-        if any(qa_status in from_status for qa_status in qa_statuses):
-            if any(dev_term in to_status for dev_term in dev_statuses):
-                failed_qa.append({
-                    "timestamp": transition.get("timestamp"),
-                    "from_status": transition.get("from_status"),
-                    "to_status": transition.get("to_status")
-                })
+        if from_flags & QA_BIT and to_flags & DEV_BIT:
+            failed_qa.append({
+                "timestamp": transition.get("timestamp"),
+                "from_status": transition.get("from_status"),
+                "to_status": transition.get("to_status")
+            })
     
     return {
         "entered_qa": entered_qa,
@@ -109,49 +196,14 @@ def analyze_rework_patterns(transitions: List[Dict]) -> Dict:
     Returns:
         Dictionary with rework_count, rework_transitions list, and has_rework boolean
     """
-    workflow_order = {
-    "backlog": 0,
-    "to do": 1,
-    "not done": 1,
-    "in progress": 2,
-    "development": 2,
-    "dev": 2,
-    "qa": 3,
-    "testing": 3,
-    "test": 3,
-    "review": 3,
-    "in review": 3,
-    "ready for deployment": 4,
-    "done": 4, 
-    }
-    
-    def get_workflow_position(status: str) -> int:
-        """
-        Get workflow position for a status.
-        
-            Returns 0 for unknown statuses.
-        
-            
-        Args:
-            status: Status string
-        
-        Returns:
-            Workflow position integer (0-6)
-        """
-        status_lower = (status or "").lower().strip()
-        for key, pos in workflow_order.items():
-            if key in status_lower:
-                return pos
-        return 0
-    
     rework_transitions = []
     
     for transition in transitions:
         from_status = transition.get("from_status", "")
         to_status = transition.get("to_status", "")
         
-        from_pos = get_workflow_position(from_status)
-        to_pos = get_workflow_position(to_status)
+        from_pos = _status_flags(from_status) >> _WORKFLOW_POS_SHIFT
+        to_pos = _status_flags(to_status) >> _WORKFLOW_POS_SHIFT
         
         if to_pos < from_pos and from_pos > 0:
             rework_transitions.append({
@@ -170,12 +222,24 @@ def analyze_rework_patterns(transitions: List[Dict]) -> Dict:
     }
 
 
+_BUG_FIX_STATUSES = frozenset(['bug fix', 'bugfix'])
+_QA_SOURCE_STATUSES = frozenset(['qa', 'quality assurance', 'testing', 'test', 'review', 'in review', 'qa testing'])
+_IN_QA_STATUSES = frozenset(['qa', 'quality assurance', 'testing', 'qa testing', 'test'])
+_NOT_DONE_STATUSES = frozenset(['to do', 'backlog', 'open', 'new', 'todo', 'not done', "won't do", "wont do"])
+_IN_PROGRESS_STATUSES = frozenset(['in progress', 'inprogress', 'active', 'development', 'doing', 'review', 'in review'])
+_DONE_STATUSES = frozenset(['done', 'closed', 'ready for deployment', 'resolved', 'deployed', 'completed', 'finished'])
+
+_STATUS_CATEGORIES: Dict[tuple, str] = {}
+
+
 def map_status_to_category(status: str, from_status: str = None) -> str:
     """
     Map Jira status to one of 4 categories: Not Done, In Progress, In QA, or Done.
     
     Maps statuses to categories: qa/testing/review -> In QA, to do/backlog/open -> Not Done, in progress/development -> In Progress,
     done/closed/resolved -> Done. Returns 'Not Done' as default for unknown statuses.
+    String inputs are mapped once per (status, from_status) pair and cached in _STATUS_CATEGORIES, since
+    lead-time analysis maps every transition of every issue.
     
     
     Args:
@@ -185,31 +249,47 @@ def map_status_to_category(status: str, from_status: str = None) -> str:
     Returns:
         Category string: 'Not Done', 'In Progress', 'In QA', or 'Done'
     """
-    if not status or pd.isna(status):
+    cacheable = isinstance(status, str) and (from_status is None or isinstance(from_status, str))
+    if cacheable:
+        category = _STATUS_CATEGORIES.get((status, from_status))
+        if category is not None:
+            return category
+    
+    category = _map_status_to_category(status, from_status)
+    if cacheable:
+        _STATUS_CATEGORIES[(status, from_status)] = category
+    return category
+
+
+def _map_status_to_category(status, from_status=None):
+    """Uncached map_status_to_category."""
+    if not status or (isinstance(status, float) and math.isnan(status)):
         return 'Not Done'
     
     status_lower = str(status).lower().strip()
     from_status_lower = str(from_status).lower().strip() if from_status else ""
     
-    if status_lower in ['bug fix', 'bugfix']:
-        if from_status_lower in ['qa', 'quality assurance', 'testing', 'test', 'review', 'in review', 'qa testing']:
+    if status_lower in _BUG_FIX_STATUSES:
+        if from_status_lower in _QA_SOURCE_STATUSES:
             return 'In Progress'
     
-    if status_lower in ['qa', 'quality assurance', 'testing', 'qa testing', 'test']:
+    if status_lower in _IN_QA_STATUSES:
         return 'In QA'
-    elif status_lower in ['bug fix', 'bugfix']:
+    elif status_lower in _BUG_FIX_STATUSES:
         return 'In QA'
-    elif status_lower in ['to do', 'backlog', 'open', 'new', 'todo', 'not done', "won't do", "wont do"]:
+    elif status_lower in _NOT_DONE_STATUSES:
         return 'Not Done'
-    elif status_lower in ['in progress', 'inprogress', 'active', 'development', 'doing', 'review', 'in review']:
+    elif status_lower in _IN_PROGRESS_STATUSES:
         return 'In Progress'
-    elif status_lower in ['done', 'closed', 'ready for deployment', 'resolved', 'deployed', 
-                    'completed', 'finished']:
+    elif status_lower in _DONE_STATUSES:
         return 'Done'
     else:
         return 'Not Done'
 
 
+_LEAD_TIME_FIELDS = ("timestamp", "timestamp_us", "from_status", "to_status")
+
+
 def calculate_lead_time_from_transitions(transitions: List[Dict], created_date: str, resolved_date: Optional[str]) -> Dict:
     """
     Calculate lead time metrics from changelog transitions.
@@ -220,6 +300,9 @@ def calculate_lead_time_from_transitions(transitions: List[Dict], created_date:
     
     not just creation date.
     
+    Results are memoized on the (timestamp, timestamp_us, from_status, to_status) sequence plus created/resolved dates,
+    so issues recomputed on every request only pay for the calculation once. Each call returns its own copy.
+    
     Args:
         transitions: List of status transition dictionaries
         created_date: Issue creation date string (ISO format)
@@ -228,6 +311,32 @@ def calculate_lead_time_from_transitions(transitions: List[Dict], created_date:
     Returns:
         Dictionary with lead_time_days, time_in_progress, time_in_qa, time_to_first_progress, status_breakdown, category_breakdown
     """
+    try:
+        transition_key = tuple(
+            tuple((field, t[field]) for field in _LEAD_TIME_FIELDS if field in t)
+            for t in (transitions or [])
+        )
+        cached = _cached_lead_time(transition_key, created_date, resolved_date)
+    except (TypeError, AttributeError):
+        return _calculate_lead_time(transitions, created_date, resolved_date)
+    
+    # Copy the nested breakdown dicts too, so callers can't modify the memoized result
+    result = dict(cached)
+    for key in ("status_breakdown", "category_breakdown"):
+        if key in result:
+            result[key] = dict(result[key])
+    return result
+
+
+@lru_cache(maxsize=4096)
+def _cached_lead_time(transition_key, created_date, resolved_date) -> Dict:
+    """Rebuild transitions from a hashable key and calculate lead time (memoized)."""
+    transitions = [dict(fields) for fields in transition_key]
+    return _calculate_lead_time(transitions, created_date, resolved_date)
+
+
+def _calculate_lead_time(transitions: List[Dict], created_date: str, resolved_date: Optional[str]) -> Dict:
+    """Uncached lead time calculation backing calculate_lead_time_from_transitions."""
     if not transitions:
         try:
             created = datetime.fromisoformat(created_date.replace('Z', '+00:00'))
@@ -298,8 +407,8 @@ def calculate_lead_time_from_transitions(transitions: List[Dict], created_date:
                 except:
                     continue
         
-        status_times = {}
-        category_times = {}
+        status_times = defaultdict(float)
+        category_times = defaultdict(float)
         
         if sorted_transitions:
             try:
@@ -308,32 +417,26 @@ def calculate_lead_time_from_transitions(transitions: List[Dict], created_date:
                 
                 if first_transition_time > work_start_date:
                     initial_duration = (first_transition_time - work_start_date).total_seconds() / 86400
-                    if initial_status not in status_times:
-                        status_times[initial_status] = 0
                     status_times[initial_status] += initial_duration
                     
                     initial_category = map_status_to_category(initial_status)
-                    if initial_category not in category_times:
-                        category_times[initial_category] = 0
                     category_times[initial_category] += initial_duration
             except:
                 pass
         
         for i in range(len(sorted_transitions) - 1):
             try:
-                current = datetime.fromisoformat(sorted_transitions[i].get("timestamp").replace('Z', '+00:00'))
-                next_time = datetime.fromisoformat(sorted_transitions[i + 1].get("timestamp").replace('Z', '+00:00'))
+                current_us = _transition_epoch_us(sorted_transitions[i])
+                next_us = _transition_epoch_us(sorted_transitions[i + 1])
+                if current_us is None or next_us is None:
+                    continue
                 status = sorted_transitions[i].get("to_status", "")
                 from_status = sorted_transitions[i].get("from_status", "")
-                duration = (next_time - current).total_seconds() / 86400
+                duration = (next_us - current_us) / _MICROSECONDS_PER_DAY
                 
-                if status not in status_times:
-                    status_times[status] = 0
                 status_times[status] += duration
                 
                 category = map_status_to_category(status, from_status)
-                if category not in category_times:
-                    category_times[category] = 0
                 category_times[category] += duration
             except:
                 continue
@@ -352,13 +455,9 @@ def calculate_lead_time_from_transitions(transitions: List[Dict], created_date:
                 final_from_status = sorted_transitions[-1].get("from_status", "")
                 if resolved > last_transition_time:
                     final_duration = (resolved - last_transition_time).total_seconds() / 86400
-                    if final_status not in status_times:
-                        status_times[final_status] = 0
                     status_times[final_status] += final_duration
                     
                     final_category = map_status_to_category(final_status, final_from_status)
-                    if final_category not in category_times:
-                        category_times[final_category] = 0
                     category_times[final_category] += final_duration
             except:
                 pass
@@ -1,23 +1,27 @@
 """Chart calculation services."""
 import pandas as pd
+import numpy as np
 import json
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from app.services.changelog_processor import (
-    get_status_at_date,
     extract_status_transitions,
     calculate_lead_time_from_transitions,
     analyze_rework_patterns,
     analyze_qa_transitions
 )
 from app.services.resolution_utils import (
-    count_done_during_period
+    done_status_mask
 )
-from app.services.filters import filter_planned_activities, filter_carry_over_activities
+from app.services.filters import filter_planned_activities
+from app.services.datetime_utils import datetime_ns, NAT_NS, is_utc_datetime, as_utc_datetime
 from app.services.data_accuracy import (
     ensure_changelog_usage
 )
 from app.services.transitions_helper import (
-    pre_parse_transitions
+    pre_parse_transitions,
+    analysis_cache_keys,
+    analyze_transitions_cached
 )
 
 
@@ -26,6 +30,15 @@ def _normalize_date_to_utc(dt):
     if dt is None:
         return None
 
+    if type(dt) is datetime and dt.tzinfo is timezone.utc:
+        return dt
+
+    return _normalize_date_to_utc_cached(dt)
+
+
+@lru_cache(maxsize=512)
+def _normalize_date_to_utc_cached(dt):
+    """Timestamp-based UTC conversion behind _normalize_date_to_utc, memoized for repeated period bounds."""
     ts = pd.Timestamp(dt)
 
     if ts.tz is not None:
@@ -34,80 +47,170 @@ def _normalize_date_to_utc(dt):
         return ts.tz_localize('UTC').to_pydatetime()
 
 
-DONE_STATUSES = ['Resolved', 'Done', 'Ready for Deployment', 'Ready For Deployment',
-                 'READY FOR DEPLOYMENT', 'Ready for deployment', 'Deployed',
-                 'IN REVIEW', 'In Review', 'QA', 'Bug Fix', 'BUG FIX', 'Bug FIX']
-IN_PROGRESS_STATUSES = ['In Progress', 'IN PROGRESS', 'In progress', 'In Progress',
-                        'Active', 'ACTIVE', 'Development', 'DEVELOPMENT', 'Doing', 'DOING']
+def _build_weeks(start_date, num_weeks=12, period_end=None):
+    """
+    Build the week windows shared by the weekly charts.
+    
+    The first week starts at start_date and every later week starts at midnight, 7 days after the previous one
+    (when start_date has a time of day, the second week starts on the day after the first week ends). Each week
+    ends 6 days 23:59:59 after it starts. With period_end, weeks run up to the one containing period_end;
+    otherwise num_weeks weeks are built.
+    
+    
+    Args:
+        start_date: First week start (UTC)
+        num_weeks: Number of weeks when period_end is not given (default 12)
+        period_end: Optional last date to cover (UTC)
+    
+    Returns:
+        List of dicts with Week, Week Number, Start Date, End Date, Week Label
+    """
+    week_span = pd.Timedelta(days=6, hours=23, minutes=59, seconds=59)
+    first_start = pd.Timestamp(start_date)
+    second_start = (first_start + week_span + pd.Timedelta(days=1)).floor('D')
+
+    if period_end:
+        if first_start > period_end:
+            return []
+        later_starts = pd.date_range(second_start, end=pd.Timestamp(period_end), freq='7D')
+    else:
+        if num_weeks < 1:
+            return []
+        later_starts = pd.date_range(second_start, periods=num_weeks - 1, freq='7D')
+
+    starts = later_starts.insert(0, first_start)
+    ends = starts + week_span
+    start_labels = starts.strftime('%b %d')
+    end_labels = ends.strftime('%b %d')
+
+    return [
+        {
+            'Week': f'W-{week_num:02d}',
+            'Week Number': week_num,
+            'Start Date': week_start,
+            'End Date': week_end,
+            'Week Label': f'W{week_num:02d} ({start_label} - {end_label})'
+        }
+        for week_num, (week_start, week_end, start_label, end_label) in enumerate(
+            zip(starts.to_pydatetime(), ends.to_pydatetime(), start_labels, end_labels), start=1
+        )
+    ]
+
+
+def _ensure_dt(df, columns):
+    """Coerce the given DataFrame columns to UTC datetimes in place, skipping columns that already are."""
+    for col in columns:
+        if not is_utc_datetime(df[col]):
+            df[col] = pd.to_datetime(df[col], utc=True, errors='coerce')
+    return df
+
+
+def _window_index(values, window_starts, window_ends):
+    """
+    Map each timestamp to the index of the inclusive [start, end] window containing it.
+    
+    Windows must be sorted and non-overlapping. Uses np.searchsorted on int64 nanoseconds, so all windows
+    are resolved in one vectorized pass instead of one boolean scan per window.
+    
+    
+    Args:
+        values: Series of timezone-aware datetimes (NaT allowed)
+        window_starts: Sorted list of window start datetimes (UTC)
+        window_ends: List of window end datetimes (UTC), one per start
+    
+    Returns:
+        numpy int array with the window index per value, or -1 when no window contains it
+    """
+    if not window_starts:
+        return np.full(len(values), -1)
+    
+    ts_ns = datetime_ns(values)
+    starts_ns = pd.DatetimeIndex(window_starts).as_unit('ns').asi8
+    ends_ns = pd.DatetimeIndex(window_ends).as_unit('ns').asi8
+    
+    idx = np.searchsorted(starts_ns, ts_ns, side='right') - 1
+    in_window = (idx >= 0) & (ts_ns <= ends_ns[np.maximum(idx, 0)]) & (ts_ns != NAT_NS)
+    return np.where(in_window, idx, -1)
+
+
+def _count_per_window(window_idx, num_windows, mask=None):
+    """Count rows per window index, skipping -1 entries and rows excluded by an optional boolean mask."""
+    selected = window_idx >= 0
+    if mask is not None:
+        selected &= np.asarray(mask, dtype=bool)
+    return np.bincount(window_idx[selected], minlength=num_windows)
+
+
+def _values_per_window(values, window_idx, num_windows, mask=None):
+    """
+    Split values into one array per window, keeping original row order inside each window.
+    
+    Row order is preserved so per-window sums and means add up in the same order as the equivalent
+    filtered Series would.
+    """
+    selected = window_idx >= 0
+    if mask is not None:
+        selected &= np.asarray(mask, dtype=bool)
+    counts = np.bincount(window_idx[selected], minlength=num_windows)
+    order = np.argsort(window_idx[selected], kind='stable')
+    return np.split(np.asarray(values)[selected][order], np.cumsum(counts)[:-1])
+
+
+def _done_status_mask(df, status_col):
+    """Boolean array of rows whose status column is 'Done' (mirrors count_done_during_period's column fallback)."""
+    if status_col not in df.columns:
+        if 'New Status Category' in df.columns:
+            status_col = 'New Status Category'
+        else:
+            return np.zeros(len(df), dtype=bool)
+    return done_status_mask(df, status_col)
+
+
+# Status names compared case-insensitively: match with `status.casefold() in DONE_STATUSES`
+DONE_STATUSES = frozenset(status.casefold() for status in [
+    'Resolved', 'Done', 'Ready for Deployment', 'Deployed', 'In Review', 'QA', 'Bug Fix'
+])
+IN_PROGRESS_STATUSES = frozenset(status.casefold() for status in [
+    'In Progress', 'Active', 'Development', 'Doing'
+])
+BUG_ISSUE_TYPES = frozenset(['bug', 'bugfix', 'bug fix'])
 
 
 def calculate_weekly_planned_vs_done(df_issues, start_date, num_weeks=12, df_sprints=None, period_end=None):
     """Calculate weekly planned vs done data. Expects pre-filtered df_issues."""
     start_date = _normalize_date_to_utc(start_date)
-    weeks_data = []
-    current_date = start_date
-    
     if period_end:
         period_end = _normalize_date_to_utc(period_end)
-        week_num = 1
-        
-        while current_date <= period_end:
-            week_end = current_date + timedelta(days=6, hours=23, minutes=59, seconds=59)
-            week_end = _normalize_date_to_utc(week_end)
-            
-            weeks_data.append({
-                'Week': f'W-{week_num:02d}',
-                'Week Number': week_num,
-                'Start Date': current_date,
-                'End Date': week_end,
-                'Week Label': f'W{week_num:02d} ({current_date.strftime("%b %d")} - {week_end.strftime("%b %d")})'
-            })
-            
-            if period_end <= week_end:
-                break
-            
-            next_day = week_end + timedelta(days=1)
-            current_date = next_day.replace(hour=0, minute=0, second=0, microsecond=0)
-            current_date = _normalize_date_to_utc(current_date)
-            week_num += 1
-    else:
-        for week_num in range(1, num_weeks + 1):
-            week_end = current_date + timedelta(days=6, hours=23, minutes=59, seconds=59)
-            week_end = _normalize_date_to_utc(week_end)
-
-            weeks_data.append({
-                'Week': f'W-{week_num:02d}',
-                'Week Number': week_num,
-                'Start Date': current_date,
-                'End Date': week_end,
-                'Week Label': f'W{week_num:02d} ({current_date.strftime("%b %d")} - {week_end.strftime("%b %d")})'
-            })
-            next_day = week_end + timedelta(days=1)
-            current_date = next_day.replace(hour=0, minute=0, second=0, microsecond=0)
-            current_date = _normalize_date_to_utc(current_date)
+    weeks_data = _build_weeks(start_date, num_weeks, period_end)
+
+    # Shallow copy is enough: columns are only replaced, never modified in place
+    df_issues = df_issues.copy(deep=False)
+    _ensure_dt(df_issues, ['Created', 'Updated', 'Resolved'])
 
     weekly_results = []
 
     status_col = 'Status Category (Mapped)' if 'Status Category (Mapped)' in df_issues.columns else 'New Status Category'
 
-    for week_info in weeks_data:
+    num_weeks_total = len(weeks_data)
+    week_starts = [week_info['Start Date'] for week_info in weeks_data]
+    week_ends = [min(week_info['End Date'], period_end) if period_end else week_info['End Date']
+                 for week_info in weeks_data]
+    created_idx = _window_index(df_issues['Created'], week_starts, week_ends)
+    updated_idx = _window_index(df_issues['Updated'], week_starts, week_ends)
+    resolved_idx = _window_index(df_issues['Resolved'], week_starts, week_ends)
+
+    planned_counts = (
+        _count_per_window(created_idx, num_weeks_total)
+        + _count_per_window(updated_idx, num_weeks_total)
+        - _count_per_window(created_idx, num_weeks_total, mask=created_idx == updated_idx)
+    )
+    done_counts = _count_per_window(resolved_idx, num_weeks_total, mask=_done_status_mask(df_issues, status_col))
+
+    for i, week_info in enumerate(weeks_data):
         week_start = week_info['Start Date']
         week_end = week_info['End Date']
-        effective_week_end = week_end
-        if period_end:
-            effective_week_end = min(week_end, period_end)
-        week_issues = df_issues.copy()
-
-        planned_activities = filter_planned_activities(week_issues, week_start, effective_week_end)
-        planned = len(planned_activities)
-
-        done = count_done_during_period(
-            week_issues,
-            week_start,
-            effective_week_end,
-            resolved_col='Resolved',
-            status_col=status_col
-        )
+        planned = int(planned_counts[i])
+        done = int(done_counts[i])
 
         weekly_results.append({
             'Week': week_info['Week'],
@@ -149,106 +252,68 @@ def calculate_weekly_flow(df_issues, start_date, num_weeks=12, df_sprints=None,
         Done, In Progress, Carry Over, New Issues, Total Active
     """
     start_date = _normalize_date_to_utc(start_date)
-    weeks_data = []
-    current_date = start_date
-    
     if period_end:
         period_end = _normalize_date_to_utc(period_end)
-        week_num = 1
-        
-        while current_date <= period_end:
-            week_end = current_date + timedelta(days=6, hours=23, minutes=59, seconds=59)
-            week_end = _normalize_date_to_utc(week_end)
-            
-            weeks_data.append({
-                'Week': f'W-{week_num:02d}',
-                'Week Number': week_num,
-                'Start Date': current_date,
-                'End Date': week_end,
-                'Week Label': f'W{week_num:02d} ({current_date.strftime("%b %d")} - {week_end.strftime("%b %d")})'
-            })
-            
-            if period_end <= week_end:
-                break
-            
-            next_day = week_end + timedelta(days=1)
-            current_date = next_day.replace(hour=0, minute=0, second=0, microsecond=0)
-            current_date = _normalize_date_to_utc(current_date)
-            week_num += 1
-    else:
-        for week_num in range(1, num_weeks + 1):
-            week_end = current_date + timedelta(days=6, hours=23, minutes=59, seconds=59)
-            week_end = _normalize_date_to_utc(week_end)
-
-            weeks_data.append({
-                'Week': f'W-{week_num:02d}',
-                'Week Number': week_num,
-                'Start Date': current_date,
-                'End Date': week_end,
-                'Week Label': f'W{week_num:02d} ({current_date.strftime("%b %d")} - {week_end.strftime("%b %d")})'
-            })
-            next_day = week_end + timedelta(days=1)
-            current_date = next_day.replace(hour=0, minute=0, second=0, microsecond=0)
-            current_date = _normalize_date_to_utc(current_date)
+    weeks_data = _build_weeks(start_date, num_weeks, period_end)
 
 
+    # Shallow copy is enough: columns are only replaced, never modified in place
+    df_issues = df_issues.copy(deep=False)
+    _ensure_dt(df_issues, ['Created', 'Updated', 'Resolved'])
+
     weekly_results = []
-    previous_week_active_issues = set()
 
 
     status_col = 'Status Category (Mapped)' if 'Status Category (Mapped)' in df_issues.columns else 'New Status Category'
 
-    for week_idx, week_info in enumerate(weeks_data):
-        week_start = week_info['Start Date']
-        week_end = week_info['End Date']
-        effective_week_end = week_end
-        if period_end:
-            effective_week_end = min(week_end, period_end)
-        week_issues = df_issues.copy()
-
-        issue_key_col = 'Issue key' if 'Issue key' in week_issues.columns else 'Key'
-        if issue_key_col in week_issues.columns:
-            current_week_issue_keys = set(week_issues[issue_key_col].tolist())
-        else:
-            current_week_issue_keys = set()
-
-
-        done = count_done_during_period(
-            week_issues,
-            week_start,
-            effective_week_end,
-            resolved_col='Resolved',
-            status_col=status_col
+    num_weeks_total = len(weeks_data)
+    week_starts = [week_info['Start Date'] for week_info in weeks_data]
+    week_ends = [min(week_info['End Date'], period_end) if period_end else week_info['End Date']
+                 for week_info in weeks_data]
+    created_idx = _window_index(df_issues['Created'], week_starts, week_ends)
+    updated_idx = _window_index(df_issues['Updated'], week_starts, week_ends)
+    resolved_idx = _window_index(df_issues['Resolved'], week_starts, week_ends)
+
+    done_counts = _count_per_window(resolved_idx, num_weeks_total, mask=_done_status_mask(df_issues, status_col))
+    new_issues_counts = _count_per_window(created_idx, num_weeks_total)
+
+    if status_col in df_issues.columns:
+        in_progress_mask = df_issues[status_col].isin(['In Progress', 'In QA']).to_numpy(dtype=bool)
+        in_progress_counts = (
+            _count_per_window(created_idx, num_weeks_total, mask=in_progress_mask)
+            + _count_per_window(updated_idx, num_weeks_total, mask=in_progress_mask)
+            - _count_per_window(created_idx, num_weeks_total, mask=in_progress_mask & (created_idx == updated_idx))
         )
+    else:
+        in_progress_counts = np.zeros(num_weeks_total, dtype=int)
 
+    # Carry over (see filter_carry_over_activities): created before the week and either updated in it while
+    # not Done, or resolved in it while Done. The two cases are exclusive, so each issue has one candidate week.
+    carry_status_col = next(
+        (col for col in ['Status Category (Mapped)', 'New Status Category', 'Status Category'] if col in df_issues.columns),
+        None
+    )
+    if carry_status_col:
+        is_done = done_status_mask(df_issues, carry_status_col)
+        carry_week_idx = np.where(is_done, resolved_idx, updated_idx)
+    else:
+        carry_week_idx = updated_idx
+    created_ns = datetime_ns(df_issues['Created'])
+    week_starts_ns = pd.DatetimeIndex(week_starts).as_unit('ns').asi8 if week_starts else np.zeros(0, dtype='int64')
+    created_before_week = (
+        (carry_week_idx >= 0)
+        & df_issues['Created'].notna().to_numpy()
+        & (created_ns < week_starts_ns[np.maximum(carry_week_idx, 0)] if week_starts else False)
+    )
+    carry_over_counts = _count_per_window(carry_week_idx, num_weeks_total, mask=created_before_week)
 
-        carry_over = filter_carry_over_activities(week_issues, week_start, effective_week_end)
-        carry_over_count = len(carry_over)
-
-        week_issues['Created'] = pd.to_datetime(week_issues['Created'], utc=True, errors='coerce')
-        week_issues['Updated'] = pd.to_datetime(week_issues['Updated'], utc=True, errors='coerce')
-        
-        planned_during_week = week_issues[
-            ((week_issues['Created'] >= week_start) & (week_issues['Created'] <= effective_week_end)) |
-            ((week_issues['Updated'] >= week_start) & (week_issues['Updated'] <= effective_week_end))
-        ].copy()
-        
-        if status_col in planned_during_week.columns:
-            in_progress = planned_during_week[
-                planned_during_week[status_col].isin(['In Progress', 'In QA'])
-            ]
-        else:
-            in_progress = pd.DataFrame()
-            
-        in_progress_count = len(in_progress)
-
-        week_issues['Created'] = pd.to_datetime(week_issues['Created'], utc=True, errors='coerce')
-        new_issues = week_issues[
-            (week_issues['Created'] >= week_start) &
-            (week_issues['Created'] <= effective_week_end) &
-            (week_issues['Created'].notna())
-        ]
-        new_issues_count = len(new_issues)
+    for i, week_info in enumerate(weeks_data):
+        week_start = week_info['Start Date']
+        week_end = week_info['End Date']
+        done = int(done_counts[i])
+        in_progress_count = int(in_progress_counts[i])
+        carry_over_count = int(carry_over_counts[i])
+        new_issues_count = int(new_issues_counts[i])
 
 
         weekly_results.append({
@@ -261,18 +326,9 @@ def calculate_weekly_flow(df_issues, start_date, num_weeks=12, df_sprints=None,
             'In Progress': in_progress_count,
             'Carry Over': carry_over_count,
             'New Issues': new_issues_count,
-            'Total Active': len(week_issues)
+            'Total Active': len(df_issues)
         })
 
-
-
-        week_issues['Resolved'] = pd.to_datetime(week_issues['Resolved'], utc=True, errors='coerce')
-        active_issues = week_issues[week_issues['Resolved'].isna()]
-        if issue_key_col in active_issues.columns:
-            previous_week_active_issues = set(active_issues[issue_key_col].tolist())
-        else:
-            previous_week_active_issues = current_week_issue_keys
-
     result_df = pd.DataFrame(weekly_results)
     return result_df
 
@@ -296,107 +352,53 @@ def calculate_weekly_lead_time(df_issues, start_date, num_weeks=12, df_sprints=N
         Resolved Issues Count, Overall Average
     """
     start_date = _normalize_date_to_utc(start_date)
-    weeks_data = []
-    current_date = start_date
-    
     if period_end:
         period_end = _normalize_date_to_utc(period_end)
-        week_num = 1
-        
-        while current_date <= period_end:
-            week_end = current_date + timedelta(days=6, hours=23, minutes=59, seconds=59)
-            week_end = _normalize_date_to_utc(week_end)
-            
-            weeks_data.append({
-                'Week': f'W-{week_num:02d}',
-                'Week Number': week_num,
-                'Start Date': current_date,
-                'End Date': week_end,
-                'Week Label': f'W{week_num:02d} ({current_date.strftime("%b %d")} - {week_end.strftime("%b %d")})'
-            })
-            
-            if period_end <= week_end:
-                break
-            
-            next_day = week_end + timedelta(days=1)
-            current_date = next_day.replace(hour=0, minute=0, second=0, microsecond=0)
-            current_date = _normalize_date_to_utc(current_date)
-            week_num += 1
-    else:
-        for week_num in range(1, num_weeks + 1):
-            week_end = current_date + timedelta(days=6, hours=23, minutes=59, seconds=59)
-            week_end = _normalize_date_to_utc(week_end)
-
-            weeks_data.append({
-                'Week': f'W-{week_num:02d}',
-                'Week Number': week_num,
-                'Start Date': current_date,
-                'End Date': week_end,
-                'Week Label': f'W{week_num:02d} ({current_date.strftime("%b %d")} - {week_end.strftime("%b %d")})'
-            })
-            next_day = week_end + timedelta(days=1)
-            current_date = next_day.replace(hour=0, minute=0, second=0, microsecond=0)
-            current_date = _normalize_date_to_utc(current_date)
+    weeks_data = _build_weeks(start_date, num_weeks, period_end)
 
 
-    df_issues = df_issues.copy()
-    df_issues['Created'] = pd.to_datetime(df_issues['Created'], utc=True, errors='coerce')
-    df_issues['Resolved'] = pd.to_datetime(df_issues['Resolved'], utc=True, errors='coerce')
+    # Shallow copy is enough: columns are only replaced, never modified in place
+    df_issues = df_issues.copy(deep=False)
+    _ensure_dt(df_issues, ['Created', 'Resolved'])
 
     status_col = 'Status Category (Mapped)' if 'Status Category (Mapped)' in df_issues.columns else 'New Status Category'
 
-    weekly_lead_time = []
-    all_lead_times = []
+    if 'Lead Time (Days)' not in df_issues.columns:
+        df_issues['Lead Time (Days)'] = (
+            df_issues['Resolved'] - df_issues['Created']
+        ).dt.total_seconds() / (60 * 60 * 24)
+        df_issues['Lead Time (Days)'] = df_issues['Lead Time (Days)'].fillna(0).round(2)
 
-    for week_info in weeks_data:
-        week_start = week_info['Start Date']
-        week_end = week_info['End Date']
-        effective_week_end = week_end
-        if period_end:
-            effective_week_end = min(week_end, period_end)
-        week_issues = df_issues.copy()
-
-        from app.services.resolution_utils import filter_done_issues
-        week_resolved = filter_done_issues(
-            week_issues,
-            week_start,
-            effective_week_end,
-            resolved_col='Resolved',
-            status_col=status_col
-        )
+    num_weeks_total = len(weeks_data)
+    week_starts = [week_info['Start Date'] for week_info in weeks_data]
+    week_ends = [min(week_info['End Date'], period_end) if period_end else week_info['End Date']
+                 for week_info in weeks_data]
+    resolved_idx = _window_index(df_issues['Resolved'], week_starts, week_ends)
 
-        if 'Lead Time (Days)' not in week_resolved.columns:
-            week_resolved['Created'] = pd.to_datetime(week_resolved['Created'], utc=True, errors='coerce')
-            week_resolved['Resolved'] = pd.to_datetime(week_resolved['Resolved'], utc=True, errors='coerce')
-            week_resolved['Lead Time (Days)'] = (
-                week_resolved['Resolved'] - week_resolved['Created']
-            ).dt.total_seconds() / (60 * 60 * 24)
-            week_resolved['Lead Time (Days)'] = week_resolved['Lead Time (Days)'].fillna(0).round(2)
-
-        done_positive_lt = week_resolved[week_resolved['Lead Time (Days)'] > 0]
-
-        if len(done_positive_lt) > 0:
-            avg_lead_time = done_positive_lt['Lead Time (Days)'].mean()
-            avg_lead_time = round(float(avg_lead_time), 2) if pd.notna(avg_lead_time) else 0.0
-            count = len(done_positive_lt)
-            all_lead_times.extend(done_positive_lt['Lead Time (Days)'].tolist())
-        else:
-            avg_lead_time = 0.0
-            count = 0
+    lead_times = df_issues['Lead Time (Days)'].to_numpy(dtype=float)
+    positive_lt_mask = _done_status_mask(df_issues, status_col) & (lead_times > 0) & (resolved_idx >= 0)
+    week_lead_times = _values_per_window(lead_times, resolved_idx, num_weeks_total, mask=positive_lt_mask)
+
+    weekly_lead_time = []
+
+    for i, week_info in enumerate(weeks_data):
+        count = len(week_lead_times[i])
+        avg_lead_time = round(float(week_lead_times[i].mean()), 2) if count > 0 else 0.0
 
         weekly_lead_time.append({
             'Week': week_info['Week'],
             'Week Number': week_info['Week Number'],
             'Week Label': week_info['Week Label'],
-            'Start Date': week_start,
-            'End Date': week_end,
+            'Start Date': week_info['Start Date'],
+            'End Date': week_info['End Date'],
             'Average Lead Time (days)': avg_lead_time,
             'Resolved Issues Count': count
         })
 
     df_weekly_lead_time = pd.DataFrame(weekly_lead_time)
-    overall_avg_lead_time = sum(all_lead_times) / len(all_lead_times) if all_lead_times else 0
-    overall_avg_lead_time = round(float(overall_avg_lead_time), 2) if overall_avg_lead_time else 0
+    all_lead_times = lead_times[positive_lt_mask]
+    overall_avg_lead_time = float(all_lead_times.mean()) if len(all_lead_times) > 0 else 0
+    overall_avg_lead_time = round(overall_avg_lead_time, 2) if overall_avg_lead_time else 0
     df_weekly_lead_time['Overall Average'] = overall_avg_lead_time
 
     return df_weekly_lead_time
@@ -422,15 +424,19 @@ def calculate_task_load_per_assignee(df_issues, period_start, period_end, df_spr
 
     period_start_utc = _normalize_date_to_utc(period_start)
     period_end_utc = _normalize_date_to_utc(period_end)
-    period_issues = df_issues.copy()
 
 
-    planned_activities = filter_planned_activities(period_issues, period_start_utc, period_end_utc)
+    planned_activities = filter_planned_activities(df_issues, period_start_utc, period_end_utc)
 
 
     if 'Assignee' in planned_activities.columns:
-        assigned_issues = planned_activities[planned_activities['Assignee'].notna()].copy()
-        assignee_counts = assigned_issues['Assignee'].value_counts().reset_index()
+        assigned_issues = planned_activities[planned_activities['Assignee'].notna()]
+        # Same ordering as value_counts(), but observed=True drops categories with no issues in the period
+        assignee_counts = (
+            assigned_issues.groupby('Assignee', sort=False, observed=True).size()
+            .sort_values(ascending=False)
+            .reset_index()
+        )
         assignee_counts.columns = ['Assignee', 'Task Count']
         assignee_counts = assignee_counts.sort_values('Task Count', ascending=False).reset_index(drop=True)
         return assignee_counts
@@ -460,15 +466,14 @@ def calculate_execution_success_by_assignee(df_issues, period_start, period_end,
 
     period_start_utc = _normalize_date_to_utc(period_start)
     period_end_utc = _normalize_date_to_utc(period_end)
-    period_issues = df_issues.copy()
     status_col = (
         'Status Category (Mapped)'
-        if 'Status Category (Mapped)' in period_issues.columns
+        if 'Status Category (Mapped)' in df_issues.columns
         else 'New Status Category'
     )
 
     planned_activities = filter_planned_activities(
-        period_issues, period_start_utc, period_end_utc
+        df_issues, period_start_utc, period_end_utc
     )
 
     if 'Assignee' not in planned_activities.columns:
@@ -476,65 +481,49 @@ def calculate_execution_success_by_assignee(df_issues, period_start, period_end,
             columns=['Assignee', 'Total Assigned', 'Done/Ready for Deployment', 'Success Rate (%)']
         )
 
-    assigned_issues = planned_activities[planned_activities['Assignee'].notna()].copy()
-    assignee_success = []
-
-    for assignee in assigned_issues['Assignee'].unique():
-        assignee_tasks = assigned_issues[assigned_issues['Assignee'] == assignee].copy()
-        total_assigned = len(assignee_tasks)
+    assigned_issues = planned_activities[planned_activities['Assignee'].notna().to_numpy()]
 
-        if 'Resolved' in assignee_tasks.columns:
-            assignee_tasks['Resolved'] = pd.to_datetime(
-                assignee_tasks['Resolved'], utc=True, errors='coerce'
-            )
-
-        local_status_col = status_col
-        if local_status_col not in assignee_tasks.columns:
-            if 'Status Category (Mapped)' in assignee_tasks.columns:
-                local_status_col = 'Status Category (Mapped)'
-            elif 'New Status Category' in assignee_tasks.columns:
-                local_status_col = 'New Status Category'
-            elif 'Status Category' in assignee_tasks.columns:
-                local_status_col = 'Status Category'
-            else:
-                local_status_col = None
-
-        done_mask = False
-        if local_status_col is not None and 'Resolved' in assignee_tasks.columns:
-            done_mask = (
-                assignee_tasks['Resolved'].notna()
-                & (assignee_tasks['Resolved'] >= period_start_utc)
-                & (assignee_tasks['Resolved'] <= period_end_utc)
-                & (assignee_tasks[local_status_col] == 'Done')
-            )
+    local_status_col = status_col
+    if local_status_col not in assigned_issues.columns:
+        if 'Status Category (Mapped)' in assigned_issues.columns:
+            local_status_col = 'Status Category (Mapped)'
+        elif 'New Status Category' in assigned_issues.columns:
+            local_status_col = 'New Status Category'
+        elif 'Status Category' in assigned_issues.columns:
+            local_status_col = 'Status Category'
+        else:
+            local_status_col = None
 
+    completed_mask = np.zeros(len(assigned_issues), dtype=bool)
+    if local_status_col is not None and 'Resolved' in assigned_issues.columns:
+        resolved = as_utc_datetime(assigned_issues['Resolved'])
+        completed_mask = _in_range_ns(resolved, period_start_utc, period_end_utc)
 
-        done_without_resolved = False
-        if local_status_col is not None and 'Updated' in assignee_tasks.columns:
-            assignee_tasks['Updated'] = pd.to_datetime(
-                assignee_tasks['Updated'], utc=True, errors='coerce'
+        if 'Updated' in assigned_issues.columns:
+            # Issues without a Resolved date count when updated in the period
+            updated_in_period = _in_range_ns(
+                as_utc_datetime(assigned_issues['Updated']), period_start_utc, period_end_utc
             )
-            done_without_resolved = (
-                (assignee_tasks[local_status_col] == 'Done')
-                & assignee_tasks['Resolved'].isna()  # No Resolved date
-                & assignee_tasks['Updated'].notna()
-                & (assignee_tasks['Updated'] >= period_start_utc)
-                & (assignee_tasks['Updated'] <= period_end_utc)
-            )
-
-        completed_mask = done_mask | done_without_resolved
-        completed_count = int(completed_mask.sum())
+            completed_mask = np.where(resolved.isna().to_numpy(), updated_in_period, completed_mask)
 
-        success_rate = (completed_count / total_assigned * 100) if total_assigned > 0 else 0
+        completed_mask &= done_status_mask(assigned_issues, local_status_col)
 
-        assignee_success.append({
-            'Assignee': assignee,
-            'Total Assigned': total_assigned,
-            'Done/Ready for Deployment': completed_count,
-            'Success Rate (%)': round(success_rate, 1),
-        })
+    # Group the mask alone by Assignee: assign() would copy every column of assigned_issues first
+    df_assignee_success = (
+        pd.Series(completed_mask, index=assigned_issues.index)
+        .groupby(assigned_issues['Assignee'], sort=False, observed=True)
+        .agg(['size', 'sum'])
+        .set_axis(['Total Assigned', 'Done/Ready for Deployment'], axis=1)
+        .reset_index()
+    )
+    df_assignee_success['Done/Ready for Deployment'] = df_assignee_success['Done/Ready for Deployment'].astype(int)
+    df_assignee_success['Success Rate (%)'] = [
+        round(completed_count / total_assigned * 100, 1)
+        for completed_count, total_assigned in zip(
+            df_assignee_success['Done/Ready for Deployment'], df_assignee_success['Total Assigned']
+        )
+    ]
 
-    df_assignee_success = pd.DataFrame(assignee_success)
     df_assignee_success = df_assignee_success.sort_values(
         'Success Rate (%)', ascending=False
     ).reset_index(drop=True)
@@ -560,16 +549,14 @@ def calculate_company_trend(df_issues, period_start, num_months=6, period_end=No
         Only includes months with valid data (Total Issues > 0)
     """
 
-    df_issues = df_issues.copy()
-    df_issues['Created'] = pd.to_datetime(df_issues['Created'], utc=True, errors='coerce')
-    df_issues['Resolved'] = pd.to_datetime(df_issues['Resolved'], utc=True, errors='coerce')
-    if 'Lead Time (Days)' in df_issues.columns:
-        df_issues['Lead Time (days)'] = df_issues['Lead Time (Days)']
-    else:
-        df_issues['Lead Time (days)'] = (
+    # Shallow copy is enough: columns are only replaced, never modified in place
+    df_issues = df_issues.copy(deep=False)
+    _ensure_dt(df_issues, ['Created', 'Updated', 'Resolved'])
+    if 'Lead Time (Days)' not in df_issues.columns:
+        df_issues['Lead Time (Days)'] = (
             df_issues['Resolved'] - df_issues['Created']
         ).dt.total_seconds() / (60 * 60 * 24)
-        df_issues['Lead Time (days)'] = df_issues['Lead Time (days)'].fillna(0).round(2)
+        df_issues['Lead Time (Days)'] = df_issues['Lead Time (Days)'].fillna(0).round(2)
 
 
     if period_end:
@@ -591,8 +578,8 @@ def calculate_company_trend(df_issues, period_start, num_months=6, period_end=No
 
     monthly_trend = []
     all_completion_rates = []
-    all_lead_times = []
-    done_statuses_lower = [s.lower() for s in DONE_STATUSES]
+    lead_time_sum = 0.0
+    lead_time_count = 0
 
 
     current_date = end_date.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
@@ -611,67 +598,44 @@ def calculate_company_trend(df_issues, period_start, num_months=6, period_end=No
         temp_date = _normalize_date_to_utc(temp_date)
     months_to_process.reverse()
 
-    for current_date in months_to_process:
-        month_start = current_date.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        month_start = _normalize_date_to_utc(month_start)
-
+    status_col = 'Status Category (Mapped)' if 'Status Category (Mapped)' in df_issues.columns else 'New Status Category'
 
+    month_starts = []
+    month_ends = []
+    for month_start in months_to_process:
         if month_start.month == 12:
             month_end = datetime(month_start.year + 1, 1, 1, tzinfo=month_start.tzinfo) - timedelta(days=1)
         else:
             month_end = datetime(month_start.year, month_start.month + 1, 1, tzinfo=month_start.tzinfo) - timedelta(days=1)
         month_end = month_end.replace(hour=23, minute=59, second=59, microsecond=999999)
-        month_end = _normalize_date_to_utc(month_end)
-
-        month_start_utc = _normalize_date_to_utc(month_start)
-        month_end_utc = _normalize_date_to_utc(month_end)
-        month_issues = df_issues.copy()
-
-
-        status_col = 'Status Category (Mapped)' if 'Status Category (Mapped)' in month_issues.columns else 'New Status Category'
-
-
-        planned_activities = filter_planned_activities(month_issues, month_start_utc, month_end_utc)
-        total_issues = len(planned_activities)
-
-
-        done_count = count_done_during_period(
-            month_issues,
-            month_start_utc,
-            month_end_utc,
-            resolved_col='Resolved',
-            status_col=status_col
-        )
-
+        month_starts.append(month_start)
+        month_ends.append(_normalize_date_to_utc(month_end))
+
+    # Single pass over the frame: bucket each issue into its month once, then count per month
+    num_months_total = len(months_to_process)
+    created_idx = _window_index(df_issues['Created'], month_starts, month_ends)
+    updated_idx = _window_index(df_issues['Updated'], month_starts, month_ends)
+    resolved_idx = _window_index(df_issues['Resolved'], month_starts, month_ends)
+
+    planned_counts = (
+        _count_per_window(created_idx, num_months_total)
+        + _count_per_window(updated_idx, num_months_total)
+        - _count_per_window(created_idx, num_months_total, mask=created_idx == updated_idx)
+    )
+    done_mask = _done_status_mask(df_issues, status_col)
+    done_counts = _count_per_window(resolved_idx, num_months_total, mask=done_mask)
+    lead_times = df_issues['Lead Time (Days)'].to_numpy(dtype=float)
+    month_lead_times = _values_per_window(lead_times, resolved_idx, num_months_total, mask=done_mask & (lead_times > 0))
+
+    for i, month_start in enumerate(month_starts):
+        total_issues = int(planned_counts[i])
+        done_count = int(done_counts[i])
         completion_rate = (done_count / total_issues * 100) if total_issues > 0 else 0
 
-
-
-        from app.services.resolution_utils import filter_done_issues
-        month_resolved = filter_done_issues(
-            month_issues,
-            month_start_utc,
-            month_end_utc,
-            resolved_col='Resolved',
-            status_col=status_col
-        )
-
-
-
-        if 'Lead Time (Days)' not in month_resolved.columns:
-            month_resolved['Created'] = pd.to_datetime(month_resolved['Created'], utc=True, errors='coerce')
-            month_resolved['Resolved'] = pd.to_datetime(month_resolved['Resolved'], utc=True, errors='coerce')
-            month_resolved['Lead Time (Days)'] = (
-                month_resolved['Resolved'] - month_resolved['Created']
-            ).dt.total_seconds() / (60 * 60 * 24)
-            month_resolved['Lead Time (Days)'] = month_resolved['Lead Time (Days)'].fillna(0).round(2)
-
-        done_positive_lt = month_resolved[month_resolved['Lead Time (Days)'] > 0]
-
-        if len(done_positive_lt) > 0:
-            avg_lead_time = done_positive_lt['Lead Time (Days)'].mean()
-            avg_lead_time = round(float(avg_lead_time), 2) if pd.notna(avg_lead_time) else 0.0
-            all_lead_times.extend(done_positive_lt['Lead Time (Days)'].tolist())
+        if len(month_lead_times[i]) > 0:
+            avg_lead_time = round(float(month_lead_times[i].mean()), 2)
+            lead_time_sum += float(month_lead_times[i].sum())
+            lead_time_count += len(month_lead_times[i])
         else:
             avg_lead_time = 0.0
 
@@ -679,13 +643,13 @@ def calculate_company_trend(df_issues, period_start, num_months=6, period_end=No
             monthly_trend.append({
                 'Month': month_start.strftime('%b %Y'),
                 'Month Start': month_start,
-                'Month End': month_end,
+                'Month End': month_ends[i],
                 'Planned': total_issues,
                 'Total Issues': total_issues,
                 'Done Count': done_count,
                 'Completion Rate (%)': round(completion_rate, 1),
-                'Average Lead Time (days)': round(avg_lead_time, 2) if avg_lead_time is not None and pd.notna(avg_lead_time) else 0.0,
-                'Resolved Issues Count': len(month_resolved)
+                'Average Lead Time (days)': avg_lead_time,
+                'Resolved Issues Count': done_count
             })
             all_completion_rates.append(completion_rate)
 
@@ -693,7 +657,7 @@ def calculate_company_trend(df_issues, period_start, num_months=6, period_end=No
 
 
     overall_avg_completion = sum(all_completion_rates) / len(all_completion_rates) if all_completion_rates else 0
-    overall_avg_lead_time = sum(all_lead_times) / len(all_lead_times) if all_lead_times else 0
+    overall_avg_lead_time = lead_time_sum / lead_time_count if lead_time_count else 0
 
     df_company_trend['Overall Avg Completion (%)'] = overall_avg_completion
     df_company_trend['Overall Avg Lead Time (days)'] = overall_avg_lead_time
@@ -701,6 +665,112 @@ def calculate_company_trend(df_issues, period_start, num_months=6, period_end=No
     return df_company_trend
 
 
+def _qa_event_arrays(parsed_transitions, cache_keys):
+    """
+    Flatten every issue's QA entries and QA failures into parallel numpy arrays.
+    
+    Runs analyze_qa_transitions once per issue and parses all event timestamps in one vectorized
+    pd.to_datetime call, so period and week windows can be counted with range checks instead of
+    re-parsing events per window. Events with missing or unparseable timestamps are dropped.
+    
+    
+    Args:
+        parsed_transitions: Sequence of parsed transition lists, one per issue row
+        cache_keys: Per-row analysis cache keys from analysis_cache_keys
+    
+    Returns:
+        Tuple (entry_rows, entry_ns, failure_rows, failure_ns) of int64 arrays: row position and event time in
+        epoch nanoseconds
+    """
+    entry_rows, entry_timestamps, failure_rows, failure_timestamps = [], [], [], []
+
+    for row_pos, (transitions, cache_key) in enumerate(zip(parsed_transitions, cache_keys)):
+        if not transitions:
+            continue
+        try:
+            qa_analysis = analyze_transitions_cached(analyze_qa_transitions, cache_key, transitions)
+        except Exception:
+            continue
+
+        for qa_entry in qa_analysis.get('entered_qa', []):
+            entry_rows.append(row_pos)
+            entry_timestamps.append(qa_entry.get('timestamp'))
+
+        for qa_failure in qa_analysis.get('failed_qa', []):
+            failure_rows.append(row_pos)
+            failure_timestamps.append(qa_failure.get('timestamp'))
+
+    entry_rows, entry_ns = _parse_event_timestamps(entry_rows, entry_timestamps)
+    failure_rows, failure_ns = _parse_event_timestamps(failure_rows, failure_timestamps)
+    return entry_rows, entry_ns, failure_rows, failure_ns
+
+
+def _parse_event_timestamps(rows, timestamps):
+    """Parse ISO event timestamps to epoch nanoseconds in one pass, dropping NaT events along with their rows."""
+    parsed = pd.DatetimeIndex(
+        pd.to_datetime(pd.Series(timestamps, dtype=object), format='ISO8601', utc=True, errors='coerce')
+    )
+    valid = parsed.notna()
+    return np.array(rows, dtype='int64')[valid], parsed.as_unit('ns').asi8[valid]
+
+
+def _events_per_issue_week(event_rows, event_ns, pair_keys, week_starts, week_ends):
+    """
+    Count events for each (issue row, week) pair key (row * num_weeks + week).
+    
+    Events are bucketed by week, reduced to unique keys with counts, and looked up with searchsorted, so memory
+    stays O(events + pairs) instead of a dense issues x weeks matrix.
+    """
+    week_idx = _window_index(pd.to_datetime(event_ns, unit='ns', utc=True), week_starts, week_ends)
+    in_week = week_idx >= 0
+    event_keys, event_counts = np.unique(event_rows[in_week] * len(week_starts) + week_idx[in_week], return_counts=True)
+    if len(event_keys) == 0:
+        return np.zeros(len(pair_keys), dtype='int64')
+    positions = np.minimum(np.searchsorted(event_keys, pair_keys), len(event_keys) - 1)
+    return np.where(event_keys[positions] == pair_keys, event_counts[positions], 0)
+
+
+def _casefold_isin(values, names):
+    """
+    Boolean array of values whose casefolded string form is in names.
+    
+    Categorical columns are matched once per category and expanded through the codes instead of per row.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        category_matches = values.cat.categories.astype(str).str.casefold().isin(names)
+        # Code -1 (missing) picks the appended False
+        return np.append(category_matches, False)[values.cat.codes.to_numpy()]
+    return values.astype(str).str.casefold().isin(names).to_numpy(dtype=bool)
+
+
+def _qa_count_fallback(df, col):
+    """Per-row stored QA count used when no changelog event matched (`value or 0`, zeros if the column is missing)."""
+    if col not in df.columns or df.empty:
+        return np.zeros(len(df), dtype='int64')
+    values = df[col]
+    # Numeric columns need no per-value pass: `value or 0` keeps numbers (NaN included) as they are
+    if values.dtype.kind in 'iu':
+        return values.to_numpy(dtype='int64')
+    if values.dtype.kind == 'f':
+        return values.to_numpy(dtype='float64')
+    return np.array([value or 0 for value in values.tolist()])
+
+
+def _sum_with_zero_fallback(counts, fallback):
+    """
+    Sum per-issue counts for a sprint, applying the stored-count fallback while the running total is zero.
+    
+    Equivalent to accumulating row by row and replacing a zero total with max(total, fallback): only the
+    first row that makes the total non-zero can contribute its fallback, and only if it had no events.
+    """
+    fallback = np.fmax(fallback, 0)
+    total = counts.sum()
+    nonzero = np.flatnonzero((counts > 0) | (fallback > 0))
+    if len(nonzero) and counts[nonzero[0]] == 0:
+        total = total + fallback[nonzero[0]]
+    return total.item()
+
+
 def calculate_qa_vs_failed(df_issues, period_start, period_end, group_by='sprint', df_sprints=None):
     """
     Calculate QA executed vs failed QA metrics using changelog transitions for accuracy.
@@ -716,93 +786,57 @@ def calculate_qa_vs_failed(df_issues, period_start, period_end, group_by='sprint
     Returns:
         DataFrame with columns: Sprint/Week, Sprint Name/Week Label, qaExecuted, failedQA
     """
-    from app.services.changelog_processor import analyze_qa_transitions
-
-
     df_issues, usage_stats = ensure_changelog_usage(df_issues, 'qa_vs_failed')
 
 
     period_start_utc = _normalize_date_to_utc(period_start)
     period_end_utc = _normalize_date_to_utc(period_end)
-    period_issues = df_issues.copy()
+    period_issues = df_issues.copy(deep=False)
 
 
-    period_issues['Created'] = pd.to_datetime(period_issues['Created'], utc=True, errors='coerce')
-    period_issues['Updated'] = pd.to_datetime(period_issues['Updated'], utc=True, errors='coerce')
-    period_issues['Resolved'] = pd.to_datetime(period_issues['Resolved'], utc=True, errors='coerce')
+    _ensure_dt(period_issues, ['Created', 'Updated', 'Resolved'])
 
-    if group_by == 'sprint':
+    period_issues = pre_parse_transitions(period_issues)
+    qa_events = _qa_event_arrays(period_issues['_parsed_transitions'].values, analysis_cache_keys(period_issues))
+    num_issues = len(period_issues)
 
-        qa_results = []
+    if 'Issue Type' in period_issues.columns:
+        is_bug = _casefold_isin(period_issues['Issue Type'], BUG_ISSUE_TYPES)
+    else:
+        is_bug = np.zeros(num_issues, dtype=bool)
+    entered_fallback = _qa_count_fallback(period_issues, 'QA Entered Count')
+    failed_fallback = _qa_count_fallback(period_issues, 'QA Failed Count')
 
+    if group_by == 'sprint':
 
-        sprint_issues = period_issues.copy()
-
-
-        if 'Sprint' in sprint_issues.columns:
-            unique_sprints = sprint_issues['Sprint'].dropna().unique()
-
-            for sprint_name in unique_sprints:
-                sprint_issues_filtered = sprint_issues[sprint_issues['Sprint'] == sprint_name].copy()
-
-                qa_executed_count = 0
-                failed_qa_count = 0
-
-
-                sprint_issues_filtered = pre_parse_transitions(sprint_issues_filtered)
-
-
-                for _, row in sprint_issues_filtered.iterrows():
-                    transitions = row.get('_parsed_transitions', [])
-                    issue_type = str(row.get('Issue Type', '')).lower()
-                    is_bug = issue_type in ['bug', 'bugfix', 'bug fix']
-
-                    if is_bug:
-                        qa_executed_count += 1
-                    else:
-                        if transitions:
-                            try:
-                                qa_analysis = analyze_qa_transitions(transitions)
-                                entered_qa = qa_analysis.get('entered_qa', [])
-                                for qa_entry in entered_qa:
-                                    qa_timestamp = qa_entry.get('timestamp')
-                                    if qa_timestamp:
-                                        try:
-                                            qa_date = datetime.fromisoformat(qa_timestamp.replace('Z', '+00:00'))
-                                            if period_start_utc <= qa_date <= period_end_utc:
-                                                qa_executed_count += 1
-                                        except:
-                                            pass
-                            except:
-                                pass
-
-
-                    if transitions:
-                        try:
-                            qa_analysis = analyze_qa_transitions(transitions)
-                            failed_qa_list = qa_analysis.get('failed_qa', [])
-                            for qa_failure in failed_qa_list:
-                                failure_timestamp = qa_failure.get('timestamp')
-                                if failure_timestamp:
-                                    try:
-                                        failure_date = datetime.fromisoformat(failure_timestamp.replace('Z', '+00:00'))
-                                        if period_start_utc <= failure_date <= period_end_utc:
-                                            failed_qa_count += 1
-                                    except:
-                                        pass
-                        except:
-                            pass
-
-                    if 'QA Entered Count' in row and qa_executed_count == 0:
-                        qa_executed_count = max(qa_executed_count, row.get('QA Entered Count', 0) or 0)
-                    if 'QA Failed Count' in row and failed_qa_count == 0:
-                        failed_qa_count = max(failed_qa_count, row.get('QA Failed Count', 0) or 0)
+        qa_results = []
 
+        period_start_ns = pd.Timestamp(period_start_utc).value
+        period_end_ns = pd.Timestamp(period_end_utc).value
+        entry_rows, entry_ns, fail_rows, fail_ns = qa_events
+        entry_in_period = (entry_ns >= period_start_ns) & (entry_ns <= period_end_ns)
+        fail_in_period = (fail_ns >= period_start_ns) & (fail_ns <= period_end_ns)
+        issue_qa_executed = np.where(is_bug, 1, np.bincount(entry_rows[entry_in_period], minlength=num_issues))
+        issue_failed_qa = np.bincount(fail_rows[fail_in_period], minlength=num_issues)
+
+        if 'Sprint' in period_issues.columns:
+            # One partition pass: ngroup() numbers sprints in first-appearance order (-1 for rows without a sprint)
+            sprint_groups = period_issues.groupby('Sprint', sort=False, observed=True)
+            sprint_idx = sprint_groups.ngroup().fillna(-1).to_numpy(dtype='int64')
+            sprint_names = sprint_groups.size().index
+            num_sprints = len(sprint_names)
+
+            sprint_qa_executed = _values_per_window(issue_qa_executed, sprint_idx, num_sprints)
+            sprint_entered_fallback = _values_per_window(entered_fallback, sprint_idx, num_sprints)
+            sprint_failed_qa = _values_per_window(issue_failed_qa, sprint_idx, num_sprints)
+            sprint_failed_fallback = _values_per_window(failed_fallback, sprint_idx, num_sprints)
+
+            for i, sprint_name in enumerate(sprint_names):
                 qa_results.append({
                     'sprint': str(sprint_name),
                     'sprintName': str(sprint_name),
-                    'qaExecuted': qa_executed_count,
-                    'failedQA': failed_qa_count
+                    'qaExecuted': _sum_with_zero_fallback(sprint_qa_executed[i], sprint_entered_fallback[i]),
+                    'failedQA': _sum_with_zero_fallback(sprint_failed_qa[i], sprint_failed_fallback[i])
                 })
 
         result_df = pd.DataFrame(qa_results)
@@ -811,106 +845,99 @@ def calculate_qa_vs_failed(df_issues, period_start, period_end, group_by='sprint
 
     else:
 
-        weeks_data = []
-        current_date = period_start_utc
-        week_num = 1
-
-        while current_date <= period_end_utc:
-            week_end = current_date + timedelta(days=6, hours=23, minutes=59, seconds=59)
-            week_end = _normalize_date_to_utc(week_end)
-            week_issues = period_issues.copy()
-
-            qa_executed_count = 0
-            failed_qa_count = 0
-
-
-            week_issues = pre_parse_transitions(week_issues)
-
-
-            for _, row in week_issues.iterrows():
-                transitions = row.get('_parsed_transitions', [])
-                issue_type = str(row.get('Issue Type', '')).lower()
-                is_bug = issue_type in ['bug', 'bugfix', 'bug fix']
-                
-                
-                issue_created = pd.to_datetime(row.get('Created'), utc=True, errors='coerce')
-                issue_updated = pd.to_datetime(row.get('Updated'), utc=True, errors='coerce')
-                issue_resolved = pd.to_datetime(row.get('Resolved'), utc=True, errors='coerce')
-                issue_active_in_week = (
-                    (pd.notna(issue_created) and current_date <= issue_created <= week_end) or
-                    (pd.notna(issue_updated) and current_date <= issue_updated <= week_end) or
-                    (pd.notna(issue_resolved) and current_date <= issue_resolved <= week_end)
-                )
-                
-                if not issue_active_in_week:
-                    continue  
-
-                issue_qa_executed = 0
-                issue_failed_qa = 0
-
-
-                if is_bug:
-                    issue_qa_executed = 1
-                else:
-                    if transitions:
-                        try:
-                            qa_analysis = analyze_qa_transitions(transitions)
-                            entered_qa = qa_analysis.get('entered_qa', [])
-                            for qa_entry in entered_qa:
-                                qa_timestamp = qa_entry.get('timestamp')
-                                if qa_timestamp:
-                                    try:
-                                        qa_date = datetime.fromisoformat(qa_timestamp.replace('Z', '+00:00'))
-                                        if current_date <= qa_date <= week_end:
-                                            issue_qa_executed += 1
-                                    except:
-                                        pass
-                        except:
-                            pass
-                    
-                    if issue_qa_executed == 0 and 'QA Entered Count' in row:
-                        issue_qa_executed = row.get('QA Entered Count', 0) or 0
-
-                if transitions:
-                    try:
-                        qa_analysis = analyze_qa_transitions(transitions)
-                        failed_qa_list = qa_analysis.get('failed_qa', [])
-                        for qa_failure in failed_qa_list:
-                            failure_timestamp = qa_failure.get('timestamp')
-                            if failure_timestamp:
-                                try:
-                                    failure_date = datetime.fromisoformat(failure_timestamp.replace('Z', '+00:00'))
-                                    if current_date <= failure_date <= week_end:
-                                        issue_failed_qa += 1
-                                except:
-                                    pass
-                    except:
-                        pass
-                
-
-                if issue_failed_qa == 0 and 'QA Failed Count' in row:
-                    issue_failed_qa = row.get('QA Failed Count', 0) or 0
-                
-                qa_executed_count += issue_qa_executed
-                failed_qa_count += issue_failed_qa
-
-            weeks_data.append({
-                'week': f'W{week_num:02d}',
-                'weekLabel': f'W{week_num:02d} ({current_date.strftime("%b %d")} - {week_end.strftime("%b %d")})',
-                'qaExecuted': qa_executed_count,
-                'failedQA': failed_qa_count
-            })
+        weeks = _build_weeks(period_start_utc, period_end=period_end_utc)
+        week_starts = [week['Start Date'] for week in weeks]
+        week_ends = [week['End Date'] for week in weeks]
+        weeks_data = [
+            {'week': f"W{week['Week Number']:02d}", 'weekLabel': week['Week Label']}
+            for week in weeks
+        ]
+
+        num_weeks_total = len(weeks_data)
+        if num_weeks_total == 0:
+            return pd.DataFrame(weeks_data)
+        row_positions = np.arange(num_issues)
+
+        # An issue counts towards a week when it was created, updated or resolved during it, so each issue has
+        # at most three active weeks; keep them as unique (row * num_weeks + week) pair keys
+        pair_keys = []
+        for col in ['Created', 'Updated', 'Resolved']:
+            week_idx = _window_index(period_issues[col], week_starts, week_ends)
+            in_week = week_idx >= 0
+            pair_keys.append(row_positions[in_week] * num_weeks_total + week_idx[in_week])
+        pair_keys = np.unique(np.concatenate(pair_keys))
+        pair_rows, pair_weeks = np.divmod(pair_keys, num_weeks_total)
+
+        entry_rows, entry_ns, fail_rows, fail_ns = qa_events
+        entry_counts = _events_per_issue_week(entry_rows, entry_ns, pair_keys, week_starts, week_ends)
+        fail_counts = _events_per_issue_week(fail_rows, fail_ns, pair_keys, week_starts, week_ends)
+
+        issue_qa_executed = np.where(
+            is_bug[pair_rows], 1, np.where(entry_counts > 0, entry_counts, entered_fallback[pair_rows])
+        )
+        issue_failed_qa = np.where(fail_counts > 0, fail_counts, failed_fallback[pair_rows])
 
-            next_day = week_end + timedelta(days=1)
-            current_date = next_day.replace(hour=0, minute=0, second=0, microsecond=0)
-            current_date = _normalize_date_to_utc(current_date)
-            week_num += 1
+        qa_executed_counts = np.zeros(num_weeks_total, dtype=issue_qa_executed.dtype)
+        np.add.at(qa_executed_counts, pair_weeks, issue_qa_executed)
+        failed_qa_counts = np.zeros(num_weeks_total, dtype=issue_failed_qa.dtype)
+        np.add.at(failed_qa_counts, pair_weeks, issue_failed_qa)
+
+        for i, week in enumerate(weeks_data):
+            week['qaExecuted'] = qa_executed_counts[i].item()
+            week['failedQA'] = failed_qa_counts[i].item()
 
         result_df = pd.DataFrame(weeks_data)
 
         return result_df
 
 
+# Sentinels for _earliest_rework_ns: rework on or before any week end / never rework
+_REWORK_ALWAYS_NS = np.iinfo('int64').min
+_REWORK_NEVER_NS = np.iinfo('int64').max
+
+
+def _earliest_rework_ns(parsed_transitions, has_rework_flags, cache_keys):
+    """
+    Earliest rework transition timestamp per issue row, as UTC epoch nanoseconds.
+    
+    Runs analyze_rework_patterns once per issue and parses every rework timestamp in one vectorized
+    pd.to_datetime call (via _parse_event_timestamps). Rows without a dated rework transition get
+    _REWORK_NEVER_NS; rows whose transitions cannot be analyzed fall back to the 'Has Rework' flag
+    (_REWORK_ALWAYS_NS if set).
+    
+    
+    Args:
+        parsed_transitions: Sequence of parsed transition lists, one per issue row
+        has_rework_flags: Sequence of 'Has Rework' flags, one per issue row
+        cache_keys: Per-row analysis cache keys from analysis_cache_keys
+    
+    Returns:
+        numpy int64 array with one timestamp or sentinel per row
+    """
+    earliest = np.full(len(parsed_transitions), _REWORK_NEVER_NS, dtype='int64')
+    rework_rows, rework_timestamps = [], []
+
+    for row_pos, (transitions, has_rework_flag, cache_key) in enumerate(
+        zip(parsed_transitions, has_rework_flags, cache_keys)
+    ):
+        if not transitions:
+            continue
+        try:
+            rework_analysis = analyze_transitions_cached(analyze_rework_patterns, cache_key, transitions)
+        except:
+            if has_rework_flag:
+                earliest[row_pos] = _REWORK_ALWAYS_NS
+            continue
+
+        for rework_trans in rework_analysis.get('rework_transitions', []):
+            rework_rows.append(row_pos)
+            rework_timestamps.append(rework_trans.get('timestamp'))
+
+    rework_rows, rework_ns = _parse_event_timestamps(rework_rows, rework_timestamps)
+    np.minimum.at(earliest, rework_rows, rework_ns)
+    return earliest
+
+
 def calculate_rework_ratio(df_issues, start_date, num_weeks=12, df_sprints=None, period_end=None):
     """
     Calculate rework ratio (clean delivery vs rework) per week.
@@ -929,60 +956,18 @@ def calculate_rework_ratio(df_issues, start_date, num_weeks=12, df_sprints=None,
     Returns:
         DataFrame with columns: Week, Week Label, cleanDelivery, rework
     """
-    from app.services.changelog_processor import analyze_rework_patterns
-
-
     df_issues, usage_stats = ensure_changelog_usage(df_issues, 'rework_ratio')
 
 
     start_date = _normalize_date_to_utc(start_date)
-    weeks_data = []
-    current_date = start_date
-    
     if period_end:
         period_end = _normalize_date_to_utc(period_end)
-        week_num = 1
-        
-        while current_date <= period_end:
-            week_end = current_date + timedelta(days=6, hours=23, minutes=59, seconds=59)
-            week_end = _normalize_date_to_utc(week_end)
-            
-            weeks_data.append({
-                'Week': f'W-{week_num:02d}',
-                'Week Number': week_num,
-                'Start Date': current_date,
-                'End Date': week_end,
-                'Week Label': f'W{week_num:02d} ({current_date.strftime("%b %d")} - {week_end.strftime("%b %d")})'
-            })
-            
-            if period_end <= week_end:
-                break
-            
-            next_day = week_end + timedelta(days=1)
-            current_date = next_day.replace(hour=0, minute=0, second=0, microsecond=0)
-            current_date = _normalize_date_to_utc(current_date)
-            week_num += 1
-    else:
-        for week_num in range(1, num_weeks + 1):
-            week_end = current_date + timedelta(days=6, hours=23, minutes=59, seconds=59)
-            week_end = _normalize_date_to_utc(week_end)
-
-            weeks_data.append({
-                'Week': f'W-{week_num:02d}',
-                'Week Number': week_num,
-                'Start Date': current_date,
-                'End Date': week_end,
-                'Week Label': f'W{week_num:02d} ({current_date.strftime("%b %d")} - {week_end.strftime("%b %d")})'
-            })
-            next_day = week_end + timedelta(days=1)
-            current_date = next_day.replace(hour=0, minute=0, second=0, microsecond=0)
-            current_date = _normalize_date_to_utc(current_date)
+    weeks_data = _build_weeks(start_date, num_weeks, period_end)
 
 
-    df_issues = df_issues.copy()
-    df_issues['Created'] = pd.to_datetime(df_issues['Created'], utc=True, errors='coerce')
-    df_issues['Updated'] = pd.to_datetime(df_issues['Updated'], utc=True, errors='coerce')
-    df_issues['Resolved'] = pd.to_datetime(df_issues['Resolved'], utc=True, errors='coerce')
+    # Shallow copy is enough: columns are only replaced, never modified in place
+    df_issues = df_issues.copy(deep=False)
+    _ensure_dt(df_issues, ['Created', 'Updated', 'Resolved'])
 
 
     status_col = 'Status Category (Mapped)' if 'Status Category (Mapped)' in df_issues.columns else 'New Status Category'
@@ -990,77 +975,40 @@ def calculate_rework_ratio(df_issues, start_date, num_weeks=12, df_sprints=None,
 
     weekly_results = []
 
-    for week_info in weeks_data:
-        week_start = week_info['Start Date']
-        week_end = week_info['End Date']
-        effective_week_end = week_end
-        if period_end:
-            effective_week_end = min(week_end, period_end)
-        week_issues = df_issues.copy()
-
-
-        from app.services.resolution_utils import filter_done_issues
-        week_resolved = filter_done_issues(
-            week_issues,
-            week_start,
-            effective_week_end,
-            resolved_col='Resolved',
-            status_col=status_col
-        )
-
-        if len(week_resolved) == 0:
-
-            weekly_results.append({
-                'Week': week_info['Week'],
-                'Week Label': week_info['Week Label'],
-                'week': f'W{week_info["Week Number"]:02d}',
-                'cleanDelivery': 1.0,
-                'rework': 0.0,
-                'Rework Count': 0,
-                'Resolved Count': 0
-            })
-            continue
-
-
-        week_resolved = pre_parse_transitions(week_resolved)
-
-
-        rework_issues = set()
-        total_resolved = len(week_resolved)
-
-        for idx, issue in week_resolved.iterrows():
-            issue_key = issue.get('Issue key', idx)
-            transitions = issue.get('_parsed_transitions', [])
-
-
-            if transitions:
-                try:
-                    if transitions:
-
-                        rework_analysis = analyze_rework_patterns(transitions)
-
-
-                        if rework_analysis.get('has_rework', False):
-
-                            rework_transitions = rework_analysis.get('rework_transitions', [])
-                            for rework_trans in rework_transitions:
-                                rework_timestamp = rework_trans.get('timestamp')
-                                if rework_timestamp:
-                                    try:
-                                        rework_date = datetime.fromisoformat(rework_timestamp.replace('Z', '+00:00'))
-
-                                        if rework_date <= week_end:
-                                            rework_issues.add(issue_key)
-                                            break
-                                    except:
-                                        pass
-                except:
-
-                    if issue.get('Has Rework', False):
-                        rework_issues.add(issue_key)
-                    pass
+    done_issues = pre_parse_transitions(
+        df_issues[_done_status_mask(df_issues, status_col) & df_issues['Resolved'].notna().to_numpy()]
+    )
+    if 'Issue key' in done_issues.columns:
+        issue_keys = done_issues['Issue key'].to_numpy()
+    else:
+        issue_keys = done_issues.index.to_numpy()
+    if 'Has Rework' in done_issues.columns:
+        has_rework_flags = done_issues['Has Rework']
+    else:
+        has_rework_flags = [False] * len(done_issues)
+    earliest_rework_ns = _earliest_rework_ns(
+        done_issues['_parsed_transitions'].tolist(), has_rework_flags, analysis_cache_keys(done_issues)
+    )
 
-        rework_count = len(rework_issues)
+    # One bucketing pass: resolution windows are clamped to period_end, rework is compared to the full week end
+    num_weeks_total = len(weeks_data)
+    week_starts = [week_info['Start Date'] for week_info in weeks_data]
+    week_ends = [week_info['End Date'] for week_info in weeks_data]
+    effective_week_ends = [min(week_end, period_end) if period_end else week_end for week_end in week_ends]
+    resolved_idx = _window_index(done_issues['Resolved'], week_starts, effective_week_ends)
+    in_week = resolved_idx >= 0
+
+    resolved_counts = _count_per_window(resolved_idx, num_weeks_total)
+    week_ends_ns = pd.DatetimeIndex(week_ends).as_unit('ns').asi8
+    is_rework = in_week.copy()
+    is_rework[in_week] = earliest_rework_ns[in_week] <= week_ends_ns[resolved_idx[in_week]]
+    # Rework is counted once per issue key within a week
+    rework_pairs = pd.DataFrame({'week': resolved_idx[is_rework], 'key': issue_keys[is_rework]}).drop_duplicates()
+    rework_counts = np.bincount(rework_pairs['week'].to_numpy(dtype='int64'), minlength=num_weeks_total)
+
+    for i, week_info in enumerate(weeks_data):
+        total_resolved = int(resolved_counts[i])
+        rework_count = int(rework_counts[i])
         rework_ratio = rework_count / total_resolved if total_resolved > 0 else 0.0
         clean_delivery_ratio = 1.0 - rework_ratio
 
@@ -1079,6 +1027,85 @@ def calculate_rework_ratio(df_issues, start_date, num_weeks=12, df_sprints=None,
     return result_df
 
 
+def _in_range_ns(values, start_dt, end_dt, out=None):
+    """
+    Boolean array of timestamps within [start_dt, end_dt], compared as int64 nanoseconds (NaT is never in range).
+    
+    With out, the result is OR-ed into that array in place instead of allocating a new one.
+    """
+    ts_ns = datetime_ns(values)
+    in_range = ts_ns >= pd.Timestamp(start_dt).value
+    in_range &= ts_ns <= pd.Timestamp(end_dt).value
+    if out is None:
+        return in_range
+    out |= in_range
+    return out
+
+
+def _active_in_period(df, start_dt, end_dt):
+    """Boolean array of issues created, updated or resolved within [start_dt, end_dt]."""
+    active = _in_range_ns(df['Created'], start_dt, end_dt)
+    _in_range_ns(df['Updated'], start_dt, end_dt, out=active)
+    _in_range_ns(df['Resolved'], start_dt, end_dt, out=active)
+    return active
+
+
+def _lead_time_or_nan(transitions, created, resolved):
+    """Changelog-based lead time in days for one issue, or NaN when it cannot be calculated."""
+    if not (transitions and created and resolved):
+        return np.nan
+    try:
+        created_str = created.isoformat() if hasattr(created, 'isoformat') else str(created)
+        resolved_str = resolved.isoformat() if hasattr(resolved, 'isoformat') else str(resolved)
+
+        lead_time_days = calculate_lead_time_from_transitions(
+            transitions,
+            created_str,
+            resolved_str
+        ).get('lead_time_days')
+    except:
+        return np.nan
+    return np.nan if lead_time_days is None else lead_time_days
+
+
+def _calc_lead_time_batch(transitions_list, created, resolved):
+    """
+    Calculate changelog-based lead times for a batch of issues into one float array.
+    
+    Fills the result with np.fromiter instead of building per-row pandas objects.
+    Issues without transitions or dates, or whose lead time cannot be calculated, get NaN.
+    
+    
+    Args:
+        transitions_list: Sequence of parsed transition lists
+        created: Sequence of created timestamps
+        resolved: Sequence of resolved timestamps
+    
+    Returns:
+        numpy float64 array of lead times in days
+    """
+    return np.fromiter(
+        (_lead_time_or_nan(transitions, c, r) for transitions, c, r in zip(transitions_list, created, resolved)),
+        dtype='f8',
+        count=len(transitions_list)
+    )
+
+
+def _positive_lead_times_by_assignee(assignees, lead_times, mask):
+    """
+    Collect lead times (days > 0) of the masked rows, grouped by assignee in row order.
+    
+    NaN lead times (issues whose lead time cannot be calculated) are skipped.
+    """
+    selected = mask & (lead_times > 0)
+
+    lead_times_by_assignee = {}
+    for assignee_name, lead_time_days in zip(assignees[selected], lead_times[selected].tolist()):
+        lead_times_by_assignee.setdefault(assignee_name, []).append(lead_time_days)
+
+    return lead_times_by_assignee
+
+
 def calculate_assignee_completion_trend(df_issues, period_start, period_end,
                                        compare_period_start=None, compare_period_end=None,
                                        assignee=None, df_sprints=None):
@@ -1111,125 +1138,66 @@ def calculate_assignee_completion_trend(df_issues, period_start, period_end,
         compare_period_end_utc = _normalize_date_to_utc(compare_period_end)
 
 
-    df_issues = df_issues.copy()
-    df_issues['Created'] = pd.to_datetime(df_issues['Created'], utc=True, errors='coerce')
-    df_issues['Updated'] = pd.to_datetime(df_issues['Updated'], utc=True, errors='coerce')
-    df_issues['Resolved'] = pd.to_datetime(df_issues['Resolved'], utc=True, errors='coerce')
-
-
-    if 'Status Category (Mapped)' not in df_issues.columns:
-        from app.services.changelog_processor import map_status_to_category
-        if 'Status' in df_issues.columns:
-            df_issues['Status Category (Mapped)'] = df_issues['Status'].apply(map_status_to_category)
-        elif 'New Status Category' in df_issues.columns:
-            df_issues['Status Category (Mapped)'] = df_issues['New Status Category']
-        else:
-            df_issues['Status Category (Mapped)'] = 'Not Done'
+    # Shallow copy is enough: columns are only replaced, never modified in place
+    df_issues = df_issues.copy(deep=False)
+    _ensure_dt(df_issues, ['Created', 'Updated', 'Resolved'])
 
 
     if assignee and assignee != "All Assignees" and assignee.strip():
-        df_issues = df_issues[df_issues['Assignee'] == assignee].copy()
+        df_issues = df_issues[df_issues['Assignee'] == assignee]
 
 
-    if 'Assignee' in df_issues.columns:
-        unique_assignees = df_issues[df_issues['Assignee'].notna()]['Assignee'].unique()
-    else:
+    if 'Assignee' not in df_issues.columns:
         return pd.DataFrame()
 
-    trend_results = []
-
-    for assignee_name in unique_assignees:
-        assignee_issues = df_issues[df_issues['Assignee'] == assignee_name].copy()
+    # 'Status Category (Mapped)' is precomputed on the cached frame by _ensure_data_format
+    is_done = _done_status_mask(df_issues, 'Status Category (Mapped)')
+    current_active = _active_in_period(df_issues, period_start_utc, period_end_utc)
+    current_done = current_active & is_done & _in_range_ns(df_issues['Resolved'], period_start_utc, period_end_utc)
+    previous_active = _active_in_period(df_issues, compare_period_start_utc, compare_period_end_utc)
+    previous_done = (
+        previous_active & is_done & _in_range_ns(df_issues['Resolved'], compare_period_start_utc, compare_period_end_utc)
+    )
 
+    # One groupby for all per-assignee counts; sort=False keeps first-appearance order of assignees.
+    # Only the four mask arrays are grouped, so the issue frame itself is not copied by assign()
+    period_counts = pd.DataFrame({
+        'current_active': current_active,
+        'current_done': current_done,
+        'previous_active': previous_active,
+        'previous_done': previous_done
+    }, index=df_issues.index).groupby(df_issues['Assignee'], sort=False, observed=True).sum()
+
+    # Lead times are calculated once for every issue done in either period, then split per period
+    either_done = (current_done | previous_done) & df_issues['Assignee'].notna().to_numpy()
+    done_issues = pre_parse_transitions(df_issues[either_done])
+    done_lead_times = _calc_lead_time_batch(
+        done_issues['_parsed_transitions'].tolist(), done_issues['Created'], done_issues['Resolved']
+    )
+    done_assignees = done_issues['Assignee'].to_numpy()
+    current_lead_times_by_assignee = _positive_lead_times_by_assignee(
+        done_assignees, done_lead_times, current_done[either_done]
+    )
+    previous_lead_times_by_assignee = _positive_lead_times_by_assignee(
+        done_assignees, done_lead_times, previous_done[either_done]
+    )
 
-        current_period_issues = assignee_issues[
-            ((assignee_issues['Created'] >= period_start_utc) & (assignee_issues['Created'] <= period_end_utc)) |
-            ((assignee_issues['Updated'] >= period_start_utc) & (assignee_issues['Updated'] <= period_end_utc)) |
-            ((assignee_issues['Resolved'] >= period_start_utc) & (assignee_issues['Resolved'] <= period_end_utc))
-        ].copy()
+    trend_results = []
 
-        current_total_assigned = len(current_period_issues)
-        current_done = current_period_issues[
-            (current_period_issues['Status Category (Mapped)'] == 'Done') &
-            (current_period_issues['Resolved'] >= period_start_utc) &
-            (current_period_issues['Resolved'] <= period_end_utc)
-        ]
-        current_total_done = len(current_done)
+    for assignee_name, counts in zip(period_counts.index, period_counts.itertuples(index=False)):
+        current_total_assigned = int(counts.current_active)
+        current_total_done = int(counts.current_done)
         current_completion_rate = (current_total_done / current_total_assigned * 100) if current_total_assigned > 0 else 0.0
 
-
-
-        current_done = pre_parse_transitions(current_done)
-
-        current_lead_times = []
-        for _, row in current_done.iterrows():
-            transitions = row.get('_parsed_transitions', [])
-            created = row.get('Created')
-            resolved = row.get('Resolved')
-
-            if transitions and created and resolved:
-                try:
-                    if transitions:
-                        created_str = created.isoformat() if hasattr(created, 'isoformat') else str(created)
-                        resolved_str = resolved.isoformat() if hasattr(resolved, 'isoformat') else str(resolved)
-
-                        lead_time_result = calculate_lead_time_from_transitions(
-                            transitions,
-                            created_str,
-                            resolved_str
-                        )
-                        lead_time_days = lead_time_result.get('lead_time_days')
-                        if lead_time_days is not None and lead_time_days > 0:
-                            current_lead_times.append(lead_time_days)
-                except:
-                    pass
-
+        current_lead_times = current_lead_times_by_assignee.get(assignee_name, [])
         current_avg_lead_time = sum(current_lead_times) / len(current_lead_times) if len(current_lead_times) > 0 else 0.0
         current_avg_lead_time = round(float(current_avg_lead_time), 2) if pd.notna(current_avg_lead_time) else 0.0
 
-
-        previous_period_issues = assignee_issues[
-            ((assignee_issues['Created'] >= compare_period_start_utc) & (assignee_issues['Created'] <= compare_period_end_utc)) |
-            ((assignee_issues['Updated'] >= compare_period_start_utc) & (assignee_issues['Updated'] <= compare_period_end_utc)) |
-            ((assignee_issues['Resolved'] >= compare_period_start_utc) & (assignee_issues['Resolved'] <= compare_period_end_utc))
-        ].copy()
-
-        previous_total_assigned = len(previous_period_issues)
-        previous_done = previous_period_issues[
-            (previous_period_issues['Status Category (Mapped)'] == 'Done') &
-            (previous_period_issues['Resolved'] >= compare_period_start_utc) &
-            (previous_period_issues['Resolved'] <= compare_period_end_utc)
-        ]
-        previous_total_done = len(previous_done)
+        previous_total_assigned = int(counts.previous_active)
+        previous_total_done = int(counts.previous_done)
         previous_completion_rate = (previous_total_done / previous_total_assigned * 100) if previous_total_assigned > 0 else 0.0
 
-
-
-        previous_done = pre_parse_transitions(previous_done)
-
-        previous_lead_times = []
-        for _, row in previous_done.iterrows():
-            transitions = row.get('_parsed_transitions', [])
-            created = row.get('Created')
-            resolved = row.get('Resolved')
-
-            if transitions and created and resolved:
-                try:
-                    if transitions:
-                        created_str = created.isoformat() if hasattr(created, 'isoformat') else str(created)
-                        resolved_str = resolved.isoformat() if hasattr(resolved, 'isoformat') else str(resolved)
-
-                        lead_time_result = calculate_lead_time_from_transitions(
-                            transitions,
-                            created_str,
-                            resolved_str
-                        )
-                        lead_time_days = lead_time_result.get('lead_time_days')
-                        if lead_time_days is not None and lead_time_days > 0:
-                            previous_lead_times.append(lead_time_days)
-                except:
-                    pass
-
+        previous_lead_times = previous_lead_times_by_assignee.get(assignee_name, [])
         previous_avg_lead_time = sum(previous_lead_times) / len(previous_lead_times) if len(previous_lead_times) > 0 else 0.0
         previous_avg_lead_time = round(float(previous_avg_lead_time), 2) if pd.notna(previous_avg_lead_time) else 0.0
 
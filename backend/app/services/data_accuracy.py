@@ -1,13 +1,39 @@
 import pandas as pd
 import json
-from typing import Dict, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
+
+# Roughly one entry per issue in the cached Jira frame, like the transitions parse cache
+_CHANGELOG_CHECK_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=_CHANGELOG_CHECK_CACHE_SIZE)
+def _json_has_transitions(transitions_json: str) -> bool:
+    """True when the JSON string parses to a non-empty value. Memoized: every chart request checks the same strings."""
+    try:
+        transitions = json.loads(transitions_json)
+        return bool(transitions) and len(transitions) > 0
+    except (ValueError, TypeError):
+        return False
+
+
+def _has_transitions(transitions_data: Any) -> bool:
+    """True when an issue's Status Transitions value is a non-empty list or a JSON string of one; parse errors count as no changelog."""
+    if isinstance(transitions_data, str):
+        return _json_has_transitions(transitions_data)
+    try:
+        return bool(transitions_data) and len(transitions_data) > 0
+    except (ValueError, TypeError):
+        return False
 
 
 def ensure_changelog_usage(df: pd.DataFrame, calculation_type: str) -> Tuple[pd.DataFrame, Dict]:
     """
     Ensure changelog data is used when available for maximum accuracy.
     
-    Counts issues with usable changelog vs fallback. Calculates changelog usage rate percentage.
+    Counts issues with usable changelog vs fallback; a non-empty transitions list or a JSON string that parses to
+    one counts as changelog, and each distinct string is parsed once. Calculates changelog usage rate percentage.
     Returns DataFrame unchanged and statistics dictionary.
     
     
@@ -30,19 +56,14 @@ def ensure_changelog_usage(df: pd.DataFrame, calculation_type: str) -> Tuple[pd.
         stats['changelog_usage_rate'] = 0.0
         return df, stats
     
-    for _, row in df.iterrows():
-        transitions_json = row.get('Status Transitions')
-        if transitions_json:
-            try:
-                transitions = json.loads(transitions_json) if isinstance(transitions_json, str) else transitions_json
-                if transitions and len(transitions) > 0:
-                    stats['issues_using_changelog'] += 1
-                else:
-                    stats['issues_using_fallback'] += 1
-            except:
-                stats['issues_using_fallback'] += 1
-        else:
-            stats['issues_using_fallback'] += 1
+    transitions = df['Status Transitions']
+    if transitions.dtype == object or isinstance(transitions.dtype, pd.StringDtype):
+        issues_using_changelog = int(transitions.map(_has_transitions).sum())
+    else:
+        issues_using_changelog = 0
+    
+    stats['issues_using_changelog'] = issues_using_changelog
+    stats['issues_using_fallback'] = len(df) - issues_using_changelog
     
     stats['changelog_usage_rate'] = (
         stats['issues_using_changelog'] / stats['total_issues'] * 100
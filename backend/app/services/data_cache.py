@@ -1,15 +1,70 @@
+import threading
 import time
+from collections import OrderedDict
+import numpy as np
 import pandas as pd
 
 from app.data_fetcher import fetch_jira_data_with_sprints
 from app.data_cleaner import clean_jira_data, prepare_dashboard_data
+from app.services.changelog_processor import map_status_to_category
+from app.services.transitions_helper import (
+    parse_transitions, clear_transition_analysis_cache, transitions_parse_cache_info
+)
+from app.services.filters import apply_standard_filters, window_bounds_ns
+from app.services.datetime_utils import NAT_NS, datetime_ns, is_utc_datetime
+from app.services.resolution_utils import IS_DONE_COL
+
+
+# Filtered frames kept per (cache timestamp, filter arguments); one dashboard render reuses them across charts
+_FILTERED_CACHE_SIZE = 32
+
+
+def _activity_times_ns(df):
+    """Sorted distinct Created/Updated/Resolved values as int64 nanoseconds (None when a column is missing or not a datetime)."""
+    columns = ['Created', 'Updated', 'Resolved']
+    if not all(col in df.columns and df[col].dtype.kind == 'M' for col in columns):
+        return None
+    times_ns = np.unique(np.concatenate([datetime_ns(df[col]) for col in columns]))
+    return times_ns[times_ns != NAT_NS]
+
+
+def _window_key(activity_ns, start_date, end_date):
+    """
+    Memo key for an activity window.
+    
+    filter_by_overall_window keeps an issue when any of its activity dates is inside the window, so two windows
+    holding the same activity timestamps of the snapshot select the same rows. Keying on the bounds' positions
+    among those timestamps lets windows ending at different moments of "now" share one entry.
+    
+    
+    Args:
+        activity_ns: Sorted activity timestamps of the snapshot (see _activity_times_ns), or None
+        start_date: Activity window start
+        end_date: Activity window end
+    
+    Returns:
+        tuple: hashable key for the window
+    """
+    if start_date is None or end_date is None:
+        return None
+    if activity_ns is None:
+        return ('bounds', start_date, end_date)
+    start_ns, end_ns = window_bounds_ns(start_date, end_date)
+    first = int(np.searchsorted(activity_ns, start_ns, side='left'))
+    stop = int(np.searchsorted(activity_ns, end_ns, side='right'))
+    if stop <= first:
+        # No activity timestamp inside: every such window selects nothing
+        return ('positions', 0, 0)
+    return ('positions', first, stop)
 
 
 def _ensure_data_format(df):
     """
-    Ensure DataFrame date columns are properly formatted as UTC datetime.
+    Ensure DataFrame date columns are properly formatted as UTC datetime (nanosecond unit).
     
-    Converts Primary Sprint Id to int or None. Returns empty DataFrame as-is.
+    Converts Primary Sprint Id to nullable Int64 (<NA> when missing), adds 'Status Category (Mapped)' if missing,
+    precomputes the 'Is Done' flag from it and parses Status Transitions once into '_parsed_transitions'.
+    Returns empty DataFrame as-is.
     
     
     Args:
@@ -30,24 +85,94 @@ def _ensure_data_format(df):
             if not pd.api.types.is_datetime64_any_dtype(df[col]):
                 df[col] = pd.to_datetime(df[col], utc=True, errors='coerce')
             if pd.api.types.is_datetime64_any_dtype(df[col]):
-                if df[col].dt.tz is None:
+                tz = getattr(df[col].dtype, 'tz', None)
+                if tz is None:
                     df[col] = df[col].dt.tz_localize('UTC')
-                elif str(df[col].dt.tz) != 'UTC':
+                elif not is_utc_datetime(df[col]):
                     df[col] = df[col].dt.tz_convert('UTC')
+                # Nanosecond unit lets date filters read int64 values as a zero-copy view
+                if df[col].dt.unit != 'ns':
+                    df[col] = df[col].dt.as_unit('ns')
     
     if 'Primary Sprint Id' in df.columns:
-        df['Primary Sprint Id'] = df['Primary Sprint Id'].apply(
-            lambda x: int(x) if pd.notna(x) else None
-        )
+        df['Primary Sprint Id'] = pd.to_numeric(df['Primary Sprint Id'], errors='coerce').astype('Int64')
+    
+    if 'Status Category (Mapped)' not in df.columns and 'Status' in df.columns:
+        df['Status Category (Mapped)'] = df['Status'].map(map_status_to_category)
+    
+    if 'Status Category (Mapped)' in df.columns:
+        df[IS_DONE_COL] = (df['Status Category (Mapped)'] == 'Done').to_numpy(dtype=bool)
+    
+    if 'Status Transitions' in df.columns and '_parsed_transitions' not in df.columns:
+        df['_parsed_transitions'] = df['Status Transitions'].map(parse_transitions)
+    
+    return df
+
+
+# Low-cardinality label columns used for filtering and grouping, plus the per-week display labels
+# prepare_dashboard_data adds (a few hundred distinct strings repeated on every issue).
+# Always group these with observed=True: a filtered frame keeps every category of the cache, and the
+# default (observed=False) emits empty groups for all of them, or their full product for multi-key groupbys.
+_CATEGORY_COLUMNS = [
+    'Assignee', 'Issue Type', 'Priority', 'Status', 'Status Category', 'Status Category (Mapped)',
+    'New Status Category', 'Sprint', 'Sprint State', 'Sprint State (Full)', 'Project name',
+    'Resolved Week', 'Created Week', 'Updated Week',
+    'Resolved Date Range', 'Created Date Range', 'Updated Date Range'
+]
+
+
+def _optimize_dtypes(df):
+    """
+    Shrink cached issue columns so per-request copies and groupbys move fewer bytes.
+    
+    Converts object-dtype label columns to category and downcasts int64 columns to the smallest integer type.
+    Float columns are left as float64 so lead-time averages and rounding are unchanged.
+    
+    
+    Args:
+        df: DataFrame with issues
+    
+    Returns:
+        DataFrame with optimized dtypes
+    """
+    if df.empty:
+        return df
+    
+    df = df.copy()
+    
+    for col in _CATEGORY_COLUMNS:
+        if col in df.columns and df[col].dtype == object:
+            df[col] = df[col].astype('category')
+    
+    for col in df.select_dtypes(include='int64').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
     
     return df
 
 
+def _make_read_only(df):
+    """
+    Mark the cached frame's column buffers read-only.
+    
+    get_data hands out shallow copies that share these buffers, so an accidental in-place write in a caller
+    raises instead of silently changing the cache for every later request.
+    """
+    # Uses pandas internals: the block manager's arrays and the buffers behind extension arrays (_ndarray for
+    # datetimes/categoricals, _data/_mask for nullable ints). Checked against pandas 2.2.x and 2.3.x (2.3.3);
+    # requirements.txt keeps pandas below 3. A manager without 'arrays' leaves the frame writable.
+    for values in getattr(df._mgr, 'arrays', ()):
+        for buffer in (values, getattr(values, '_ndarray', None), getattr(values, '_data', None),
+                       getattr(values, '_mask', None)):
+            if isinstance(buffer, np.ndarray):
+                buffer.flags.writeable = False
+    return df
+
+
 def _ensure_sprints_format(df_sprints):
     """
     Ensure sprints DataFrame date columns are properly formatted as UTC datetime.
     
-    Converts Sprint Id to int or None. Returns empty DataFrame as-is.
+    Converts Sprint Id to nullable Int64 (<NA> when missing). Returns empty DataFrame as-is.
     
     
     Args:
@@ -67,15 +192,14 @@ def _ensure_sprints_format(df_sprints):
             if not pd.api.types.is_datetime64_any_dtype(df_sprints[col]):
                 df_sprints[col] = pd.to_datetime(df_sprints[col], utc=True, errors='coerce')
             if pd.api.types.is_datetime64_any_dtype(df_sprints[col]):
-                if df_sprints[col].dt.tz is None:
+                tz = getattr(df_sprints[col].dtype, 'tz', None)
+                if tz is None:
                     df_sprints[col] = df_sprints[col].dt.tz_localize('UTC')
-                elif str(df_sprints[col].dt.tz) != 'UTC':
+                elif not is_utc_datetime(df_sprints[col]):
                     df_sprints[col] = df_sprints[col].dt.tz_convert('UTC')
     
     if 'Sprint Id' in df_sprints.columns:
-        df_sprints['Sprint Id'] = df_sprints['Sprint Id'].astype('Int64').apply(
-            lambda x: int(x) if pd.notna(x) else None
-        )
+        df_sprints['Sprint Id'] = df_sprints['Sprint Id'].astype('Int64')
     
     return df_sprints
 
@@ -84,7 +208,8 @@ class DataCache:
     """
     Singleton cache for JIRA data.
     
-    Uses lock to prevent concurrent fetches. Returns cached data if available and not forcing refresh, otherwise fetches fresh data.
+    Uses a threading lock to prevent concurrent fetches; waiters block on it and wake as soon as the fetch finishes.
+    Returns cached data if available and not forcing refresh, otherwise fetches fresh data.
     
     """
     
@@ -92,7 +217,10 @@ class DataCache:
     _data = None
     _sprints = None
     _timestamp = 0
-    _lock = False
+    _activity = (0, None)
+    _lock = threading.Lock()
+    _filtered = OrderedDict()
+    _filtered_lock = threading.Lock()
     
     def __new__(cls):
         if cls._instance is None:
@@ -104,6 +232,7 @@ class DataCache:
         Get cached data or fetch fresh if cache is empty or force_refresh is True.
         
             Otherwise fetches fresh data from JIRA, cleans and formats it, then caches and returns copies.
+            Copies are shallow: callers may add or replace columns, but must not modify cached values in place.
         
             
         Args:
@@ -115,18 +244,21 @@ class DataCache:
         if not force_refresh and self._data is not None and self._sprints is not None:
             cache_age = time.time() - self._timestamp
             print(f"✅ Using cached data (age: {cache_age:.0f}s, {len(self._data)} issues, {len(self._sprints)} sprints)")
-            return self._data.copy(), self._sprints.copy()
+            return self._data.copy(deep=False), self._sprints.copy(deep=False)
         
-        if self._lock:
+        acquired = self._lock.acquire(blocking=False)
+        if not acquired:
             print("⏳ Data fetch already in progress, waiting...")
-            wait_time = 0
-            while self._lock and wait_time < 60:
-                time.sleep(0.5)
-                wait_time += 0.5
+            acquired = self._lock.acquire(timeout=60)
             if self._data is not None and self._sprints is not None:
-                return self._data.copy(), self._sprints.copy()
+                if acquired:
+                    self._lock.release()
+                return self._data.copy(deep=False), self._sprints.copy(deep=False)
+        elif not force_refresh and self._data is not None and self._sprints is not None:
+            # Another fetch finished between the cache check above and taking the lock
+            self._lock.release()
+            return self._data.copy(deep=False), self._sprints.copy(deep=False)
         
-        self._lock = True
         try:
             print("=== FETCHING FRESH JIRA DATA ===")
             fetch_start = time.time()
@@ -137,22 +269,84 @@ class DataCache:
             df = prepare_dashboard_data(df)
             
             df = _ensure_data_format(df)
+            df = _optimize_dtypes(df)
             if df_sprints is not None and not df_sprints.empty:
                 df_sprints = _ensure_sprints_format(df_sprints)
             
-            self._data = df
-            self._sprints = df_sprints
+            self._data = _make_read_only(df)
+            self._sprints = _make_read_only(df_sprints) if df_sprints is not None else df_sprints
             self._timestamp = time.time()
+            self._activity = (self._timestamp, _activity_times_ns(self._data))
+            clear_transition_analysis_cache()
+            with self._filtered_lock:
+                self._filtered.clear()
             
             fetch_time = time.time() - fetch_start
             print(f"✅ Data cached successfully. {len(df)} issues, {len(df_sprints)} sprints. (Fetch: {fetch_time:.2f}s)")
+            parse_stats = transitions_parse_cache_info()
+            print(f"   Transitions JSON cache: {parse_stats.hits} hits, {parse_stats.misses} misses, "
+                  f"{parse_stats.currsize}/{parse_stats.maxsize} entries")
             
-            return df.copy(), df_sprints.copy()
+            return df.copy(deep=False), df_sprints.copy(deep=False)
         except Exception as e:
             print(f"❌ Error fetching data: {e}")
             raise
         finally:
-            self._lock = False
+            if acquired:
+                self._lock.release()
+    
+    def get_filtered_data(self, assignees=None, issue_type=None, start_date=None, end_date=None):
+        """
+        Get cached data with apply_standard_filters applied, memoizing the filtered issues frame.
+        
+            Results are kept in a small LRU keyed on the cache timestamp and the filter arguments, so charts
+            rendered for the same selection filter once. The date window is keyed by the activity timestamps it
+            covers (see _window_key), so windows clamped to the current time still hit the memo.
+            Memoized frames are read-only; shallow copies are returned.
+            Results are not memoized when a fetch finishes during the call, so stale frames never outlive a refresh.
+        
+            
+        Args:
+            assignees: Optional list of assignee names
+            issue_type: Optional issue type
+            start_date: Optional activity window start (UTC)
+            end_date: Optional activity window end (UTC)
+        
+        Returns:
+            tuple: (filtered df_issues, df_sprints)
+        """
+        # Read the timestamp before the frames: if a fetch lands in between, the frames can't be tied to a key
+        timestamp = self._timestamp
+        df, df_sprints = self.get_data()
+        activity_timestamp, activity_ns = self._activity
+        memoize = timestamp == self._timestamp
+        if activity_timestamp != timestamp:
+            activity_ns = None
+        key = (timestamp, tuple(assignees) if assignees else None, issue_type,
+               _window_key(activity_ns, start_date, end_date))
+        
+        filtered = None
+        if memoize:
+            with self._filtered_lock:
+                filtered = self._filtered.get(key)
+                if filtered is not None:
+                    self._filtered.move_to_end(key)
+        
+        if filtered is None:
+            filtered = apply_standard_filters(df, assignees=assignees, issue_type=issue_type,
+                                              start_date=start_date, end_date=end_date)
+            if filtered is df:
+                # No filter was active: df is already a shallow copy of the cache, don't spend an LRU slot on it
+                return df, df_sprints
+            filtered = _make_read_only(filtered)
+            with self._filtered_lock:
+                # Skip storing when a fetch finished meanwhile: its clear of _filtered may already have run
+                if memoize and timestamp == self._timestamp:
+                    self._filtered[key] = filtered
+                    while len(self._filtered) > _FILTERED_CACHE_SIZE:
+                        self._filtered.popitem(last=False)
+        
+        return filtered.copy(deep=False), df_sprints
 
 
 _data_cache = DataCache()
@@ -171,3 +365,22 @@ def get_cached_data(force_refresh=False):
         tuple: (df_issues, df_sprints)
     """
     return _data_cache.get_data(force_refresh=force_refresh)
+
+
+def get_filtered_cached_data(assignees=None, issue_type=None, start_date=None, end_date=None):
+    """
+    Get cached JIRA data filtered with apply_standard_filters (memoized per filter arguments).
+    
+    
+    
+    Args:
+        assignees: Optional list of assignee names
+        issue_type: Optional issue type
+        start_date: Optional activity window start (UTC)
+        end_date: Optional activity window end (UTC)
+    
+    Returns:
+        tuple: (filtered df_issues, df_sprints)
+    """
+    return _data_cache.get_filtered_data(assignees=assignees, issue_type=issue_type,
+                                         start_date=start_date, end_date=end_date)
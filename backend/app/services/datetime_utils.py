@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+from datetime import timezone
+
+
+# int64 value of NaT in nanosecond arrays
+NAT_NS = np.iinfo(np.int64).min
+
+
+def datetime_ns(values) -> np.ndarray:
+    """
+    Get datetime values as int64 UTC epoch nanoseconds (NaT becomes NAT_NS).
+
+    Nanosecond datetime Series and indexes (the cached frame's date columns) are read as a zero-copy view of their
+    DatetimeArray, skipping the DatetimeIndex construction pandas goes through for tz-aware data. Other inputs are
+    converted with pd.DatetimeIndex first. The returned array may share memory with values: do not modify it.
+
+
+    Args:
+        values: Series, DatetimeIndex, DatetimeArray or list of datetimes
+
+    Returns:
+        numpy int64 array aligned to values
+    """
+    array = getattr(values, 'array', values)
+    if isinstance(array, pd.arrays.DatetimeArray) and array.unit == 'ns':
+        return array.asi8
+    return pd.DatetimeIndex(values).as_unit('ns').asi8
+
+
+def is_utc_datetime(values) -> bool:
+    """True when values (a Series or index) already has a UTC datetime64 dtype, so pd.to_datetime can be skipped."""
+    dtype = getattr(values, 'dtype', None)
+    if dtype is None or dtype.kind != 'M':
+        return False
+    tz = getattr(dtype, 'tz', None)
+    # The identity check covers what pd.to_datetime(utc=True) produces without formatting the tz
+    return tz is timezone.utc or str(tz) == 'UTC'
+
+
+def as_utc_datetime(values: pd.Series) -> pd.Series:
+    """Coerce a Series to UTC datetimes with pd.to_datetime; returned unchanged when it already has a UTC dtype."""
+    if is_utc_datetime(values):
+        return values
+    return pd.to_datetime(values, utc=True, errors='coerce')
@@ -1,70 +1,111 @@
+import numpy as np
 import pandas as pd
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Tuple
+
+from app.services.resolution_utils import done_status_mask
+from app.services.datetime_utils import datetime_ns, is_utc_datetime
+
+
+def window_bounds_ns(start_dt, end_dt) -> Tuple[int, int]:
+    """
+    Convert a period's bounds to UTC epoch nanoseconds once, treating naive datetimes as UTC.
+    
+    The date filters compare int64 column values against these, so Timestamps are not rebuilt per column.
+    
+    
+    Args:
+        start_dt: Period start datetime
+        end_dt: Period end datetime
+    
+    Returns:
+        tuple: (start_ns, end_ns)
+    """
+    if start_dt.tzinfo is None:
+        start_dt = start_dt.replace(tzinfo=timezone.utc)
+    if end_dt.tzinfo is None:
+        end_dt = end_dt.replace(tzinfo=timezone.utc)
+    return pd.Timestamp(start_dt).value, pd.Timestamp(end_dt).value
+
+
+def _between_ns(values: pd.Series, start_ns: int, end_ns: int) -> np.ndarray:
+    """Boolean array of values within [start_ns, end_ns], compared as int64 nanoseconds (NaT never matches)."""
+    values_ns = datetime_ns(values)
+    in_range = values_ns >= start_ns
+    in_range &= values_ns <= end_ns
+    return in_range
+
+
+def _any_between_ns(columns, start_ns: int, end_ns: int) -> np.ndarray:
+    """Boolean array of rows where any of the datetime Series is within [start_ns, end_ns]; one pass per column over reused buffers."""
+    num_rows = len(columns[0])
+    any_in_range = np.zeros(num_rows, dtype=bool)
+    after_start = np.empty(num_rows, dtype=bool)
+    before_end = np.empty(num_rows, dtype=bool)
+    for values in columns:
+        values_ns = datetime_ns(values)
+        np.greater_equal(values_ns, start_ns, out=after_start)
+        np.less_equal(values_ns, end_ns, out=before_end)
+        after_start &= before_end
+        any_in_range |= after_start
+    return any_in_range
 
 
 def filter_by_overall_window(df: pd.DataFrame, earliest_dt, latest_dt) -> pd.DataFrame:
     """Filter DataFrame to include issues with activity within the date window."""
-    if earliest_dt.tzinfo is None:
-        earliest_dt = earliest_dt.replace(tzinfo=timezone.utc)
-    if latest_dt.tzinfo is None:
-        latest_dt = latest_dt.replace(tzinfo=timezone.utc)
+    start_ns, end_ns = window_bounds_ns(earliest_dt, latest_dt)
     
-    df = df.copy()
-    if 'Created' in df.columns:
+    # Shallow copy: date columns below are replaced, never modified in place
+    df = df.copy(deep=False)
+    if 'Created' in df.columns and not is_utc_datetime(df['Created']):
         df['Created'] = pd.to_datetime(df['Created'], utc=True, errors='coerce')
-    if 'Updated' in df.columns:
+    if 'Updated' in df.columns and not is_utc_datetime(df['Updated']):
         df['Updated'] = pd.to_datetime(df['Updated'], utc=True, errors='coerce')
-    if 'Resolved' in df.columns:
+    if 'Resolved' in df.columns and not is_utc_datetime(df['Resolved']):
         df['Resolved'] = pd.to_datetime(df['Resolved'], utc=True, errors='coerce')
     
-    return df[
-        ((df['Created'] >= earliest_dt) & (df['Created'] <= latest_dt)) |
-        ((df['Updated'] >= earliest_dt) & (df['Updated'] <= latest_dt)) |
-        ((df['Resolved'] >= earliest_dt) & (df['Resolved'] <= latest_dt))
-    ].copy()
+    in_window = _any_between_ns([df['Created'], df['Updated'], df['Resolved']], start_ns, end_ns)
+    return df[in_window]
 
 
 def apply_selection_filters(df: pd.DataFrame, assignees, issue_types) -> pd.DataFrame:
     """Apply assignee and issue type filters to DataFrame."""
-    filtered = df.copy()
+    if not assignees and not issue_types:
+        return df
+    
+    # Category columns answer isin on their codes; combine both masks and take rows once
+    selected = np.ones(len(df), dtype=bool)
     if assignees:
-        filtered = filtered[filtered['Assignee'].isin(assignees)]
+        selected &= df['Assignee'].isin(assignees).to_numpy(dtype=bool)
     if issue_types:
-        filtered = filtered[filtered['Issue Type'].isin(issue_types)]
-    return filtered
+        selected &= df['Issue Type'].isin(issue_types).to_numpy(dtype=bool)
+    return df[selected]
 
 
 def filter_planned_activities(df: pd.DataFrame, start_dt, end_dt) -> pd.DataFrame:
     """Filter DataFrame to planned activities: Created OR Updated within period."""
-    if start_dt.tzinfo is None:
-        start_dt = start_dt.replace(tzinfo=timezone.utc)
-    if end_dt.tzinfo is None:
-        end_dt = end_dt.replace(tzinfo=timezone.utc)
+    start_ns, end_ns = window_bounds_ns(start_dt, end_dt)
     
-    df = df.copy()
-    if 'Created' in df.columns:
+    # Shallow copy: date columns below are replaced, never modified in place
+    df = df.copy(deep=False)
+    if 'Created' in df.columns and not is_utc_datetime(df['Created']):
         df['Created'] = pd.to_datetime(df['Created'], utc=True, errors='coerce')
-    if 'Updated' in df.columns:
+    if 'Updated' in df.columns and not is_utc_datetime(df['Updated']):
         df['Updated'] = pd.to_datetime(df['Updated'], utc=True, errors='coerce')
     
-    return df[
-        ((df['Created'] >= start_dt) & (df['Created'] <= end_dt)) |
-        ((df['Updated'] >= start_dt) & (df['Updated'] <= end_dt))
-    ].copy()
+    planned = _any_between_ns([df['Created'], df['Updated']], start_ns, end_ns)
+    return df[planned]
 
 
 def filter_carry_over_activities(df: pd.DataFrame, start_dt, end_dt) -> pd.DataFrame:
     """Filter DataFrame to carry-over activities: Created before period AND Updated during period."""
-    if start_dt.tzinfo is None:
-        start_dt = start_dt.replace(tzinfo=timezone.utc)
-    if end_dt.tzinfo is None:
-        end_dt = end_dt.replace(tzinfo=timezone.utc)
+    start_ns, end_ns = window_bounds_ns(start_dt, end_dt)
     
-    df = df.copy()
-    if 'Created' in df.columns:
+    # Shallow copy: date columns below are replaced, never modified in place
+    df = df.copy(deep=False)
+    if 'Created' in df.columns and not is_utc_datetime(df['Created']):
         df['Created'] = pd.to_datetime(df['Created'], utc=True, errors='coerce')
-    if 'Updated' in df.columns:
+    if 'Updated' in df.columns and not is_utc_datetime(df['Updated']):
         df['Updated'] = pd.to_datetime(df['Updated'], utc=True, errors='coerce')
     
     status_col = None
@@ -75,28 +116,23 @@ def filter_carry_over_activities(df: pd.DataFrame, start_dt, end_dt) -> pd.DataF
     elif 'Status Category' in df.columns:
         status_col = 'Status Category'
 
-    created_before = df['Created'] < start_dt
+    created_ns = datetime_ns(df['Created'])
+    created_before = df['Created'].notna().to_numpy() & (created_ns < start_ns)
+    updated_in_period = _between_ns(df['Updated'], start_ns, end_ns)
     
     if status_col and 'Resolved' in df.columns:
-        df['Resolved'] = pd.to_datetime(df['Resolved'], utc=True, errors='coerce')
-        
-        updated_in_period = (df['Updated'] >= start_dt) & (df['Updated'] <= end_dt)
-        not_done = df[status_col].astype(str) != 'Done'
+        if not is_utc_datetime(df['Resolved']):
+            df['Resolved'] = pd.to_datetime(df['Resolved'], utc=True, errors='coerce')
         
-        resolved_in_period = (df['Resolved'] >= start_dt) & (df['Resolved'] <= end_dt)
-        is_done = df[status_col].astype(str) == 'Done'
+        is_done = done_status_mask(df, status_col)
         
-        carry_over_mask = created_before & (
-            (updated_in_period & not_done) |
-            (resolved_in_period & is_done)
-        )
+        # Done issues carry over when resolved in the period, others when updated in it
+        carry_over_mask = np.where(is_done, _between_ns(df['Resolved'], start_ns, end_ns), updated_in_period)
+        carry_over_mask &= created_before
     else:
-        carry_over_mask = (
-            created_before &
-            ((df['Updated'] >= start_dt) & (df['Updated'] <= end_dt))
-        )
+        carry_over_mask = created_before & updated_in_period
     
-    return df[carry_over_mask].copy()
+    return df[carry_over_mask]
 
 
 def apply_standard_filters(df: pd.DataFrame, assignee: Optional[str] = None, 
@@ -104,20 +140,25 @@ def apply_standard_filters(df: pd.DataFrame, assignee: Optional[str] = None,
                           issue_type: Optional[str] = None, 
                           start_date: Optional[datetime] = None, 
                           end_date: Optional[datetime] = None) -> pd.DataFrame:
-    """Apply standard filters to DataFrame in consistent order across all endpoints."""
-    filtered_df = df.copy()
+    """Apply standard filters to DataFrame in consistent order across all endpoints. Returns df itself when no filter is active."""
+    filtered_df = df
     
     assignee_list = assignees
     if assignee_list is None and assignee:
         assignee_list = [assignee]
     
+    selected = None
     if assignee_list:
         valid_assignees = [a for a in assignee_list if a and a != "All Assignees" and str(a).strip()]
         if valid_assignees:
-            filtered_df = filtered_df[filtered_df['Assignee'].isin(valid_assignees)].copy()
+            selected = filtered_df['Assignee'].isin(valid_assignees).to_numpy(dtype=bool)
     
     if issue_type and issue_type != "All Types" and issue_type.strip():
-        filtered_df = filtered_df[filtered_df['Issue Type'] == issue_type].copy()
+        type_match = (filtered_df['Issue Type'] == issue_type).to_numpy(dtype=bool)
+        selected = type_match if selected is None else selected & type_match
+    
+    if selected is not None:
+        filtered_df = filtered_df[selected]
     
     if end_date is not None and start_date is not None:
         filtered_df = filter_by_overall_window(filtered_df, start_date, end_date)
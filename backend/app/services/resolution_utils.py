@@ -1,15 +1,60 @@
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from typing import Optional
 
+from app.services.datetime_utils import datetime_ns, as_utc_datetime
+
+
+# Precomputed at cache time from 'Status Category (Mapped)'
+IS_DONE_COL = 'Is Done'
+
+
+def done_status_mask(df: pd.DataFrame, status_col: str) -> np.ndarray:
+    """
+    Boolean array of rows whose status column is 'Done'.
+    
+    Reads the cached 'Is Done' column when status_col is 'Status Category (Mapped)' instead of comparing
+    strings again. The caller resolves any column fallback; a missing status_col gives an all-False mask.
+    
+    
+    Args:
+        df: DataFrame with issues
+        status_col: Column name for status category
+    
+    Returns:
+        Boolean numpy array aligned to df's rows
+    """
+    if status_col == 'Status Category (Mapped)' and IS_DONE_COL in df.columns:
+        return df[IS_DONE_COL].to_numpy(dtype=bool)
+    if status_col not in df.columns:
+        return np.zeros(len(df), dtype=bool)
+    return (df[status_col] == 'Done').to_numpy(dtype=bool)
+
+
+def _resolved_in_period(resolved: pd.Series, period_start: datetime, period_end: datetime) -> np.ndarray:
+    """
+    Boolean array of non-null resolution dates within [period_start, period_end].
+    
+    With tz-aware bounds the check runs on int64 nanoseconds (NaT is the minimum int64, so it never matches);
+    other bounds keep pandas' Timestamp comparison and its errors.
+    """
+    if getattr(period_start, 'tzinfo', None) is None or getattr(period_end, 'tzinfo', None) is None:
+        return (resolved.notna() & (resolved >= period_start) & (resolved <= period_end)).to_numpy(dtype=bool)
+    
+    resolved_ns = datetime_ns(resolved)
+    in_period = resolved_ns >= pd.Timestamp(period_start).value
+    in_period &= resolved_ns <= pd.Timestamp(period_end).value
+    return in_period
+
 
 def count_done_during_period(df: pd.DataFrame, period_start: datetime, period_end: datetime, 
                              resolved_col: str = 'Resolved', status_col: str = 'Status Category (Mapped)') -> int:
     """
     Count issues completed during a period using resolution date AND status.
     
-    Converts resolved column to datetime and checks for status column existence with fallback.
-    Returns 0 if required columns don't exist.
+    Converts resolved column to datetime (skipped when already UTC) and checks for status column existence with
+    fallback. Returns 0 if required columns don't exist.
     
     
     Args:
@@ -25,8 +70,7 @@ def count_done_during_period(df: pd.DataFrame, period_start: datetime, period_en
     if resolved_col not in df.columns:
         return 0
     
-    df = df.copy()
-    df[resolved_col] = pd.to_datetime(df[resolved_col], utc=True, errors='coerce')
+    resolved = as_utc_datetime(df[resolved_col])
     
     if status_col not in df.columns:
         if 'New Status Category' in df.columns:
@@ -34,12 +78,8 @@ def count_done_during_period(df: pd.DataFrame, period_start: datetime, period_en
         else:
             return 0
     
-    done_mask = (
-        df[resolved_col].notna() &
-        (df[resolved_col] >= period_start) &
-        (df[resolved_col] <= period_end) &
-        (df[status_col] == 'Done')
-    )
+    done_mask = _resolved_in_period(resolved, period_start, period_end)
+    done_mask &= done_status_mask(df, status_col)
     
     return done_mask.sum()
 
@@ -49,8 +89,8 @@ def filter_done_issues(df: pd.DataFrame, period_start: datetime, period_end: dat
     """
     Filter DataFrame to only include issues done during period.
     
-    Converts resolved column to datetime and checks for status column existence with fallback.
-    Returns empty DataFrame if required columns don't exist.
+    Converts resolved column to datetime (skipped when already UTC) and checks for status column existence with
+    fallback. Returns empty DataFrame if required columns don't exist.
     
     
     Args:
@@ -66,8 +106,11 @@ def filter_done_issues(df: pd.DataFrame, period_start: datetime, period_end: dat
     if resolved_col not in df.columns:
         return pd.DataFrame()
     
-    df = df.copy()
-    df[resolved_col] = pd.to_datetime(df[resolved_col], utc=True, errors='coerce')
+    resolved = as_utc_datetime(df[resolved_col])
+    if resolved is not df[resolved_col]:
+        # Shallow copy: only the converted column is replaced
+        df = df.copy(deep=False)
+        df[resolved_col] = resolved
     
     if status_col not in df.columns:
         if 'New Status Category' in df.columns:
@@ -75,11 +118,8 @@ def filter_done_issues(df: pd.DataFrame, period_start: datetime, period_end: dat
         else:
             return pd.DataFrame()
     
-    done_mask = (
-        df[resolved_col].notna() &
-        (df[resolved_col] >= period_start) &
-        (df[resolved_col] <= period_end) &
-        (df[status_col] == 'Done')
-    )
+    done_mask = _resolved_in_period(resolved, period_start, period_end)
+    done_mask &= done_status_mask(df, status_col)
     
-    return df[done_mask].copy()
+    # Boolean indexing already copies the rows; the shallow copy only detaches the result from df
+    return df[done_mask].copy(deep=False)
@@ -1,40 +1,63 @@
 import json
 import pandas as pd
-from typing import Any, List, Dict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
 
 
-def parse_transitions(transitions_data: Any) -> List[Dict]:
+# Roughly one entry per issue in the cached Jira frame; every chart request re-parses the same strings.
+_PARSED_TRANSITIONS_CACHE_SIZE = 8192
+
+# Serialized "no transitions" payloads, answered without json.loads or a cache slot
+_EMPTY_TRANSITIONS_JSON = frozenset(['', '[]', '{}', 'null'])
+
+# Shared immutable result for issues without transitions, so empty rows don't each allocate a list
+_NO_TRANSITIONS: tuple = ()
+
+# Per-issue analysis results keyed by (analyzer name, issue key, raw transitions JSON); cleared when the data cache refetches
+_TRANSITION_ANALYSIS_CACHE: Dict[tuple, Dict] = {}
+
+
+@lru_cache(maxsize=_PARSED_TRANSITIONS_CACHE_SIZE)
+def _parse_transitions_json(transitions_json: str) -> Sequence[Dict]:
+    """Parse a transitions JSON string. Memoized, so the returned list is shared and must be treated as read-only."""
+    try:
+        parsed = json.loads(transitions_json)
+    except (json.JSONDecodeError, ValueError):
+        return _NO_TRANSITIONS
+    if isinstance(parsed, list):
+        return parsed if parsed else _NO_TRANSITIONS
+    elif isinstance(parsed, dict):
+        return [parsed] if parsed else _NO_TRANSITIONS
+    else:
+        return _NO_TRANSITIONS
+
+
+def parse_transitions(transitions_data: Any) -> Sequence[Dict]:
     """
     Parse transitions from JSON string, list, or None.
     
-    parses JSON string to list, handles dict-wrapped JSON. Returns empty list on parse errors.
+    parses JSON string to list, handles dict-wrapped JSON. Returns the shared empty tuple on parse errors. JSON strings are
+    parsed through a bounded LRU cache, so repeated chart calls over the same cached frame reuse the parsed lists.
     
     
     Args:
         transitions_data: Can be None, list, or JSON string
     
     Returns:
-        List of transition dictionaries
+        List of transition dictionaries, or the shared empty tuple when there are none
     """
     if transitions_data is None or pd.isna(transitions_data):
-        return []
+        return _NO_TRANSITIONS
     
     if isinstance(transitions_data, list):
         return transitions_data
     
     if isinstance(transitions_data, str):
-        try:
-            parsed = json.loads(transitions_data)
-            if isinstance(parsed, list):
-                return parsed
-            elif isinstance(parsed, dict):
-                return [parsed] if parsed else []
-            else:
-                return []
-        except (json.JSONDecodeError, ValueError):
-            return []
+        if transitions_data.strip() in _EMPTY_TRANSITIONS_JSON:
+            return _NO_TRANSITIONS
+        return _parse_transitions_json(transitions_data)
     
-    return []
+    return _NO_TRANSITIONS
 
 
 def pre_parse_transitions(df: pd.DataFrame) -> pd.DataFrame:
@@ -42,6 +65,8 @@ def pre_parse_transitions(df: pd.DataFrame) -> pd.DataFrame:
     Pre-parse all transitions and add as '_parsed_transitions' column.
     
     Adds '_parsed_transitions' column with parsed list. Returns DataFrame with None column if 'Status Transitions' missing.
+    Frames that already carry '_parsed_transitions' (the cached frame parses once on load) are not re-parsed.
+    Returns a shallow copy: existing columns share data with df, only '_parsed_transitions' is new.
     
     
     Args:
@@ -50,12 +75,75 @@ def pre_parse_transitions(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with added '_parsed_transitions' column
     """
-    df = df.copy()
+    df = df.copy(deep=False)
+    
+    if '_parsed_transitions' in df.columns:
+        return df
     
     if 'Status Transitions' not in df.columns:
         df['_parsed_transitions'] = None
         return df
     
-    df['_parsed_transitions'] = df['Status Transitions'].apply(parse_transitions)
+    df['_parsed_transitions'] = df['Status Transitions'].map(parse_transitions)
     
     return df
+
+
+def analysis_cache_keys(df: pd.DataFrame) -> List[Optional[tuple]]:
+    """
+    Build per-row keys for analyze_transitions_cached from 'Issue key' and the raw 'Status Transitions' JSON.
+    
+    Rows without an issue key or a JSON string get None, so their analysis is never cached.
+    
+    
+    Args:
+        df: DataFrame with issues
+    
+    Returns:
+        List with one (issue_key, transitions_json) tuple or None per row
+    """
+    if 'Issue key' not in df.columns or 'Status Transitions' not in df.columns:
+        return [None] * len(df)
+    
+    return [
+        (issue_key, transitions_json) if isinstance(issue_key, str) and isinstance(transitions_json, str) else None
+        for issue_key, transitions_json in zip(df['Issue key'], df['Status Transitions'])
+    ]
+
+
+def analyze_transitions_cached(analyzer: Callable[[List[Dict]], Dict], cache_key: Optional[Hashable],
+                               transitions: List[Dict]) -> Dict:
+    """
+    Run a transition analyzer (analyze_qa_transitions, analyze_rework_patterns) with per-issue memoization.
+    
+    Results are shared between chart calculations until clear_transition_analysis_cache() is called, so they must
+    be treated as read-only. Exceptions raised by the analyzer propagate and are not cached.
+    
+    
+    Args:
+        analyzer: Function taking a transitions list and returning an analysis dictionary
+        cache_key: Key from analysis_cache_keys, or None to skip the cache
+        transitions: Parsed transitions of the issue
+    
+    Returns:
+        Analysis dictionary returned by analyzer
+    """
+    if cache_key is None:
+        return analyzer(transitions)
+    
+    key = (analyzer.__name__,) + cache_key
+    result = _TRANSITION_ANALYSIS_CACHE.get(key)
+    if result is None:
+        result = analyzer(transitions)
+        _TRANSITION_ANALYSIS_CACHE[key] = result
+    return result
+
+
+def transitions_parse_cache_info():
+    """Hit/miss statistics of the parsed transitions JSON cache (functools cache_info named tuple)."""
+    return _parse_transitions_json.cache_info()
+
+
+def clear_transition_analysis_cache() -> None:
+    """Drop memoized transition analyses (called when fresh Jira data is fetched)."""
+    _TRANSITION_ANALYSIS_CACHE.clear()
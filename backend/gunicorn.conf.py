@@ -0,0 +1,22 @@
+"""
+Gunicorn configuration for the API, loaded automatically when gunicorn is started from backend/.
+Run with: gunicorn wsgi_api:application
+
+Chart endpoints are CPU-bound pandas work, so requests are spread over several worker processes. The app is
+preloaded: create_api_app fills the data cache once in the master and forked workers share its read-only
+frames copy-on-write instead of each fetching from Jira. Connections are not shared: data_fetcher opens its Jira
+session per process, so workers never reuse the master's sockets.
+"""
+import multiprocessing
+import os
+
+bind = os.getenv("API_BIND", "0.0.0.0:8050")
+
+workers = int(os.getenv("API_WORKERS", max(2, multiprocessing.cpu_count() // 2)))
+worker_class = "gthread"
+threads = int(os.getenv("API_THREADS", 2))
+
+preload_app = True
+
+# A cache refresh fetches every issue from Jira and can take well over a minute
+timeout = 120